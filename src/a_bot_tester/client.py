@@ -1,17 +1,61 @@
 """Telethon client wrapper for bot testing."""
 
 import asyncio
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, TypeVar
 
-from telethon import TelegramClient
-from telethon.tl.types import Message
+from telethon import TelegramClient, events
+from telethon.errors import (
+    FloodWaitError,
+    PeerIdInvalidError,
+    RpcCallFailError,
+    UserIdInvalidError,
+)
+from telethon.tl.functions.messages import SendMessageRequest
+from telethon.tl.types import InputPeerUser, Message
 
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+ENTITY_CACHE_DIR = Path.home() / ".cache" / "a_bot_tester"
+
+
+def _entity_cache_path(session_name: str, username: str) -> Path:
+    """Get the cache file for a resolved username.
+    
+    Access hashes are only valid for the account that resolved them, so
+    the cache is keyed by session as well as by username.
+    """
+    return ENTITY_CACHE_DIR / f"{Path(session_name).name}_{username}.json"
+
+
+def _load_cached_peer(path: Path) -> InputPeerUser | None:
+    """Load a previously resolved bot peer, or None if not cached."""
+    try:
+        data = json.loads(path.read_text())
+        return InputPeerUser(user_id=data["id"], access_hash=data["access_hash"])
+    except (OSError, ValueError, KeyError) as e:
+        logger.debug("No usable entity cache at %s: %s", path, e)
+        return None
+
+
+def _store_cached_peer(path: Path, entity: Any) -> None:
+    """Persist a resolved bot peer for later runs."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"id": entity.id, "access_hash": entity.access_hash}
+        path.write_text(json.dumps(data))
+    except OSError as e:
+        logger.warning("Failed to write entity cache %s: %s", path, e)
+
 
 class BotTesterClient:
     """Telethon client wrapper for testing Telegram bots."""
@@ -29,20 +73,76 @@ class BotTesterClient:
             config.api_hash,
         )
         self._target_entity: Any = None
+        # Cache file the target peer was loaded from, until a request to
+        # the bot has confirmed its access hash
+        self._unconfirmed_cache: Path | None = None
+        # (message, is_edit) pairs pushed by the update handlers
+        self._updates: asyncio.Queue[tuple[Message, bool]] = asyncio.Queue()
+        # Replies share one chat, so only one exchange may wait on them at a time
+        self._exchange_lock = asyncio.Lock()
 
     async def start(self) -> None:
         """Start the Telethon client and authenticate."""
         await self.client.start(phone=self.config.phone)
         logger.info("Telegram client started successfully")
         
-        # Resolve target bot
-        self._target_entity = await self.client.get_entity(
-            f"@{self.config.target_bot_username}"
+        # Resolve target bot, reusing a cached peer to skip resolveUsername
+        username = self.config.target_bot_username
+        cache_path = _entity_cache_path(self.config.session_name, username)
+        self._target_entity = _load_cached_peer(cache_path)
+        if self._target_entity is None:
+            await self._resolve_target(cache_path)
+        else:
+            self._unconfirmed_cache = cache_path
+        logger.info("Target bot resolved: @%s", username)
+        
+        # Stream bot replies into a queue instead of polling the history
+        self.client.add_event_handler(
+            self._on_message,
+            events.NewMessage(from_users=self._target_entity, incoming=True),
+        )
+        self.client.add_event_handler(
+            self._on_edit,
+            events.MessageEdited(from_users=self._target_entity, incoming=True),
         )
-        logger.info(f"Target bot resolved: @{self.config.target_bot_username}")
+
+    async def _resolve_target(self, cache_path: Path) -> None:
+        """Resolve the target bot's username and cache the peer."""
+        username = self.config.target_bot_username
+        self._target_entity = await self._retry(
+            lambda: self.client.get_entity(f"@{username}")
+        )
+        _store_cached_peer(cache_path, self._target_entity)
+
+    async def _to_target(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run an RPC call addressed to the target bot.
+        
+        If the first such call finds the cached peer invalid (e.g. the
+        session was logged in to another account since), the cache file is
+        deleted, the username resolved again and the call retried.
+        
+        Args:
+            call: Factory returning a fresh awaitable for each attempt;
+                it must read ``self._target_entity`` when called
+            
+        Returns:
+            Result of the call
+        """
+        cache_path, self._unconfirmed_cache = self._unconfirmed_cache, None
+        try:
+            return await self._retry(call)
+        except (PeerIdInvalidError, UserIdInvalidError):
+            if cache_path is None:
+                raise
+            logger.warning("Cached peer in %s is invalid, resolving again", cache_path)
+            cache_path.unlink(missing_ok=True)
+            await self._resolve_target(cache_path)
+            return await self._retry(call)
 
     async def stop(self) -> None:
         """Stop the Telethon client."""
+        self.client.remove_event_handler(self._on_message)
+        self.client.remove_event_handler(self._on_edit)
         await self.client.disconnect()
         logger.info("Telegram client disconnected")
 
@@ -65,48 +165,71 @@ class BotTesterClient:
 
         timeout = timeout or self.config.response_timeout
         
-        # Record time before sending
-        before_send = datetime.now()
+        async with self._exchange_lock:
+            # Drop replies that arrived before this command
+            self._drain_updates()
+            
+            # Send the command
+            await self._to_target(
+                lambda: self.client.send_message(self._target_entity, command)
+            )
+            logger.info("Sent command: %s", command)
+            
+            responses = await self._collect_responses(timeout)
+        
+        logger.info(
+            "Received %d response(s) for command: %s", len(responses), command
+        )
+        return responses
+
+    async def send_commands_chain(
+        self,
+        commands: list[str],
+        timeout: int | None = None,
+    ) -> list[Message]:
+        """Send several commands in one ordered batch.
+        
+        The requests are submitted together with ``ordered=True``, which makes
+        Telethon wrap each one in ``invokeAfterMsg`` so the server processes
+        them in sequence without a round-trip per command. Replies are
+        collected only so they don't leak into the next exchange; use this
+        for setup/teardown commands whose responses aren't validated.
         
-        # Send the command
-        await self.client.send_message(self._target_entity, command)
-        logger.info(f"Sent command: {command}")
+        Args:
+            commands: Commands to send, in order
+            timeout: Timeout in seconds to wait for the bot to settle
+            
+        Returns:
+            List of response messages from the bot
+        """
+        if not self._target_entity:
+            raise RuntimeError("Client not started. Call start() first.")
         
-        # Collect responses
-        responses: list[Message] = []
-        end_time = datetime.now() + timedelta(seconds=timeout)
+        if not commands:
+            return []
         
-        # Wait a bit for initial response
-        await asyncio.sleep(0.5)
+        timeout = timeout or self.config.response_timeout
         
-        while datetime.now() < end_time:
-            # Get recent messages from the bot
-            messages = await self.client.get_messages(
-                self._target_entity,
-                limit=10,
-            )
+        async with self._exchange_lock:
+            self._drain_updates()
             
-            # Filter messages that are from the bot and after our command
-            new_messages = [
-                msg for msg in messages
-                if msg.date.replace(tzinfo=None) > before_send
-                and msg.out is False  # Message is not from us
+            requests = [
+                SendMessageRequest(self._target_entity, cmd) for cmd in commands
             ]
             
-            if new_messages:
-                # Check if we got new messages since last check
-                new_count = len(new_messages) - len(responses)
-                if new_count > 0:
-                    responses = new_messages
-                    # Wait a bit more for additional messages
-                    await asyncio.sleep(0.5)
-                else:
-                    # No new messages, we might be done
-                    break
-            else:
-                await asyncio.sleep(0.3)
+            def send_chain() -> Awaitable[Any]:
+                # Same requests (so random_ids) on each attempt, addressed to
+                # the target as currently resolved
+                for request in requests:
+                    request.peer = self._target_entity
+                return self.client(requests, ordered=True)
+            
+            await self._to_target(send_chain)
+            logger.info("Sent command chain: %s", commands)
+            
+            responses = await self._collect_responses(timeout)
         
-        logger.info(f"Received {len(responses)} response(s) for command: {command}")
+        logger.info("Received %d response(s) for command chain", len(responses))
         return responses
 
     async def send_message(self, text: str) -> None:
@@ -118,8 +241,10 @@ class BotTesterClient:
         if not self._target_entity:
             raise RuntimeError("Client not started. Call start() first.")
             
-        await self.client.send_message(self._target_entity, text)
-        logger.info(f"Sent message: {text[:50]}...")
+        await self._to_target(
+            lambda: self.client.send_message(self._target_entity, text)
+        )
+        logger.info("Sent message: %s...", text[:50])
 
     async def click_inline_button(
         self,
@@ -128,6 +253,7 @@ class BotTesterClient:
         button_data: bytes | None = None,
         row: int | None = None,
         col: int | None = None,
+        timeout: int | None = None,
     ) -> Message | None:
         """Click an inline button in a message.
         
@@ -137,6 +263,7 @@ class BotTesterClient:
             button_data: Data of the button to click
             row: Row index of the button (0-based)
             col: Column index of the button (0-based)
+            timeout: Timeout in seconds to wait for a response
             
         Returns:
             Response message or None if no response
@@ -152,7 +279,7 @@ class BotTesterClient:
             try:
                 target_button = message.buttons[row][col]
             except IndexError:
-                logger.error(f"Button at row={row}, col={col} not found")
+                logger.error("Button at row=%s, col=%s not found", row, col)
                 return None
         elif button_text:
             for btn_row in message.buttons:
@@ -175,25 +302,125 @@ class BotTesterClient:
             logger.error("Target button not found")
             return None
         
-        # Click the button
-        before_click = datetime.now()
-        await target_button.click()
-        logger.info(f"Clicked button: {target_button.text}")
+        async with self._exchange_lock:
+            # Click the button
+            self._drain_updates()
+            await self._retry(target_button.click)
+            logger.info("Clicked button: %s", target_button.text)
+            
+            # Wait for the first reply; bots often edit the clicked message instead
+            responses = await self._collect_responses(
+                timeout or self.config.response_timeout,
+                max_messages=1,
+                watch_id=message.id,
+            )
+        return responses[0] if responses else None
+
+    async def _retry(
+        self,
+        call: Callable[[], Awaitable[T]],
+        max_attempts: int = 3,
+    ) -> T:
+        """Run an RPC call, retrying on flood waits and transient failures.
         
-        # Wait for response
-        await asyncio.sleep(1)
+        ``FloodWaitError`` sleeps for the wait Telegram asks for;
+        ``RpcCallFailError`` backs off exponentially (1s, 2s, 4s, ...).
         
-        # Get response
-        messages = await self.client.get_messages(
-            self._target_entity,
-            limit=5,
-        )
+        Args:
+            call: Factory returning a fresh awaitable for each attempt
+            max_attempts: Total number of attempts before giving up
+            
+        Returns:
+            Result of the call
+        """
+        for attempt in range(1, max_attempts):
+            try:
+                return await call()
+            except FloodWaitError as e:
+                delay = e.seconds + 1
+                logger.warning(
+                    "Flood wait of %ds, retrying (attempt %d/%d)",
+                    e.seconds,
+                    attempt,
+                    max_attempts,
+                )
+            except RpcCallFailError as e:
+                delay = 2 ** (attempt - 1)
+                logger.warning("RPC call failed: %s; retrying in %ds", e, delay)
+            await asyncio.sleep(delay)
         
-        for msg in messages:
-            if msg.date.replace(tzinfo=None) > before_click and not msg.out:
-                return msg
-                
-        return None
+        return await call()
+
+    async def _on_message(self, event: events.NewMessage.Event) -> None:
+        """Queue an incoming message from the target bot.
+        
+        Args:
+            event: New message event
+        """
+        self._updates.put_nowait((event.message, False))
+
+    async def _on_edit(self, event: events.MessageEdited.Event) -> None:
+        """Queue an edit of a message from the target bot.
+        
+        Args:
+            event: Message edited event
+        """
+        self._updates.put_nowait((event.message, True))
+
+    def _drain_updates(self) -> None:
+        """Discard queued messages that were not consumed by a previous call."""
+        while not self._updates.empty():
+            self._updates.get_nowait()
+
+    async def _collect_responses(
+        self,
+        timeout: float,
+        max_messages: int | None = None,
+        watch_id: int | None = None,
+    ) -> list[Message]:
+        """Collect queued bot replies until the bot goes quiet.
+        
+        Waits up to ``timeout`` seconds for the first reply, then keeps
+        collecting until no new message arrives within the quiet window.
+        ``timeout`` is a hard cap on the total wait. Only the last
+        ``max_responses`` messages are kept, so a chatty bot can't grow
+        memory without bound.
+        
+        An edit replaces the collected version of the same message. Edits
+        of other older messages are ignored unless they target ``watch_id``.
+        
+        Args:
+            timeout: Maximum time in seconds to wait for responses
+            max_messages: Stop after this many messages (optional)
+            watch_id: ID of an existing message whose edits count as replies
+            
+        Returns:
+            List of response messages in arrival order
+        """
+        loop = asyncio.get_running_loop()
+        end_time = loop.time() + timeout
+        # Keyed by message ID so an edit updates its message in place
+        responses: dict[int, Message] = {}
+        
+        while max_messages is None or len(responses) < max_messages:
+            remaining = end_time - loop.time()
+            if remaining <= 0:
+                break
+            
+            # Wait up to the full timeout for the first reply, then the quiet window
+            wait = min(self.config.quiet_window, remaining) if responses else remaining
+            try:
+                msg, edited = await asyncio.wait_for(self._updates.get(), timeout=wait)
+            except asyncio.TimeoutError:
+                break
+            
+            if edited and msg.id not in responses and msg.id != watch_id:
+                continue
+            responses[msg.id] = msg
+            if len(responses) > self.config.max_responses:
+                del responses[next(iter(responses))]
+        
+        return list(responses.values())
 
     async def __aenter__(self) -> "BotTesterClient":
         """Async context manager entry."""
@@ -203,3 +430,80 @@ class BotTesterClient:
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
         await self.stop()
+
+
+class ClientPool:
+    """Pool of started clients shared by concurrent scenario workers.
+    
+    Telethon can't use one session file from several clients at once, so
+    with more than one member each gets its own session file
+    (``<session_name>_<i>``) that has to be authorized separately. Members
+    logged into the same account still share one chat with the bot; use a
+    separate account per session to keep their replies apart.
+    """
+
+    def __init__(self, config: Config, size: int = 1) -> None:
+        """Initialize the pool.
+        
+        Args:
+            config: Application configuration
+            size: Number of clients in the pool
+        """
+        self.config = config
+        self.size = size
+        self._clients: list[BotTesterClient] = []
+        self._idle: asyncio.Queue[BotTesterClient] = asyncio.Queue()
+
+    async def start(self) -> None:
+        """Start every client in the pool."""
+        for i in range(self.size):
+            session_name = self.config.session_name
+            if self.size > 1:
+                session_name = f"{session_name}_{i}"
+            
+            client = BotTesterClient(replace(self.config, session_name=session_name))
+            await client.start()
+            self._clients.append(client)
+            self._idle.put_nowait(client)
+        
+        logger.info("Client pool started with %d client(s)", self.size)
+
+    async def stop(self) -> None:
+        """Stop every client in the pool."""
+        for client in self._clients:
+            await client.stop()
+        self._clients.clear()
+
+    async def acquire(self) -> BotTesterClient:
+        """Take an idle client, waiting until one is released.
+        
+        Returns:
+            Started client
+        """
+        return await self._idle.get()
+
+    def release(self, client: BotTesterClient) -> None:
+        """Return a client to the pool.
+        
+        Args:
+            client: Client previously returned by acquire()
+        """
+        self._idle.put_nowait(client)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[BotTesterClient]:
+        """Acquire a client for the duration of a ``async with`` block."""
+        client = await self.acquire()
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    async def __aenter__(self) -> "ClientPool":
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.stop()
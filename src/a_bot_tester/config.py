@@ -17,6 +17,12 @@ class Config:
     target_bot_username: str
     session_name: str = "tester_session"
     response_timeout: int = 30
+    quiet_window: float = 1.0
+    max_concurrency: int = 1
+    pool_size: int = 1
+    max_responses: int = 50
+    send_rate: float = 5.0
+    send_burst: int = 3
     log_level: str = "INFO"
 
     @classmethod
@@ -30,7 +36,8 @@ class Config:
             Config instance
             
         Raises:
-            ValueError: If required environment variables are missing
+            ValueError: If required environment variables are missing, or
+                SEND_RATE/SEND_BURST can't pace sends
         """
         if env_path:
             load_dotenv(env_path)
@@ -55,6 +62,13 @@ class Config:
         if missing:
             raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
 
+        send_rate = float(os.getenv("SEND_RATE", "5.0"))
+        send_burst = int(os.getenv("SEND_BURST", "3"))
+        if send_rate <= 0:
+            raise ValueError(f"SEND_RATE must be positive, got {send_rate}")
+        if send_burst < 1:
+            raise ValueError(f"SEND_BURST must be at least 1, got {send_burst}")
+
         return cls(
             api_id=int(api_id),
             api_hash=api_hash,
@@ -62,5 +76,11 @@ class Config:
             target_bot_username=target_bot.lstrip("@"),
             session_name=os.getenv("SESSION_NAME", "tester_session"),
             response_timeout=int(os.getenv("RESPONSE_TIMEOUT", "30")),
+            quiet_window=float(os.getenv("QUIET_WINDOW", "1.0")),
+            max_concurrency=int(os.getenv("MAX_CONCURRENCY", "1")),
+            pool_size=int(os.getenv("POOL_SIZE", "1")),
+            max_responses=int(os.getenv("MAX_RESPONSES", "50")),
+            send_rate=send_rate,
+            send_burst=send_burst,
             log_level=os.getenv("LOG_LEVEL", "INFO"),
         )
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import sys
+import threading
 
 from .client import BotTesterClient
 from .config import Config
@@ -10,6 +11,45 @@ from .config import Config
 logger = logging.getLogger(__name__)
 
 
+async def _read_line(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+    
+    ``input()`` runs on a daemon thread, so update handlers keep running
+    while the user types and a pending read never holds up interpreter
+    exit (unlike ``asyncio.to_thread``, whose worker is joined on shutdown).
+    
+    Args:
+        prompt: Prompt to display
+        
+    Returns:
+        Line entered by the user
+        
+    Raises:
+        EOFError: If stdin is closed
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+    
+    def resolve(result: str | None, error: BaseException | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def worker() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:  # EOFError, or KeyboardInterrupt on some platforms
+            loop.call_soon_threadsafe(resolve, None, e)
+        else:
+            loop.call_soon_threadsafe(resolve, line, None)
+    
+    threading.Thread(target=worker, daemon=True).start()
+    return await future
+
+
 async def interactive_mode() -> None:
     """Run the tester in interactive mode."""
     logging.basicConfig(
@@ -42,8 +82,8 @@ async def interactive_mode() -> None:
         
         while True:
             try:
-                user_input = input("You> ").strip()
-            except (EOFError, KeyboardInterrupt):
+                user_input = (await _read_line("You> ")).strip()
+            except (EOFError, KeyboardInterrupt, asyncio.CancelledError):
                 print("\nExiting...")
                 break
             
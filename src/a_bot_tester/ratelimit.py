@@ -0,0 +1,47 @@
+"""Rate limiting for messages sent to the bot."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket that paces requests to a steady rate.
+    
+    Up to ``burst`` requests pass immediately; after that callers wait
+    until the bucket refills at ``rate`` tokens per second.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the bucket.
+        
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket can hold
+            
+        Raises:
+            ValueError: If rate isn't positive or burst is below 1
+        """
+        if rate <= 0:
+            raise ValueError(f"Send rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"Send burst must be at least 1, got {burst}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for the bucket to refill if it is empty."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) / self.rate)
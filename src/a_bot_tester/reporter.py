@@ -2,13 +2,43 @@
 
 import json
 import logging
-from dataclasses import dataclass, field, asdict
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Text report status labels keyed by (passed, skipped); skipped wins
+_TEXT_STATUS = {
+    (True, False): "PASS",
+    (False, False): "FAIL",
+    (False, True): "SKIP",
+    (True, True): "SKIP",
+}
+
+
+class _DataclassEncoder(json.JSONEncoder):
+    """JSON encoder that serializes dataclasses field by field.
+    
+    Unlike ``asdict``, nested objects are not deep-copied first; the encoder
+    walks the existing objects while writing.
+    """
+    
+    def default(self, o: Any) -> Any:
+        """Convert a dataclass instance to a shallow dict."""
+        if is_dataclass(o) and not isinstance(o, type):
+            return {f.name: getattr(o, f.name) for f in fields(o)}
+        return super().default(o)
+
 
 @dataclass
 class TestResult:
@@ -56,21 +86,72 @@ class TestReport:
     scenario_results: list[ScenarioResult] = field(default_factory=list)
 
 
+def _dump_json_line(obj: Any) -> bytes:
+    """Serialize an object to a single JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, cls=_DataclassEncoder).encode() + b"\n"
+
+
+@dataclass
+class _RunTotals:
+    """Counters accumulated as scenarios finish."""
+    
+    scenarios: int = 0
+    passed_scenarios: int = 0
+    tests: int = 0
+    passed_tests: int = 0
+    failed_tests: int = 0
+    skipped_tests: int = 0
+
+
+@dataclass
+class _ScenarioProgress:
+    """State of a scenario that is currently being recorded."""
+    
+    name: str
+    started_at: float  # time.monotonic() value
+    tests: list[TestResult] = field(default_factory=list)
+
+
 class TestReporter:
-    """Generates and saves test reports."""
+    """Generates and saves test reports.
+    
+    Scenario progress is tracked per asyncio task, so scenarios running
+    concurrently record their results independently.
+    
+    With ``streaming_path`` set, that file is truncated when the run starts
+    and each finished scenario is written to it as a JSON line instead of
+    being kept in memory; the final report then carries only the aggregate
+    counters.
+    """
     
-    def __init__(self) -> None:
-        """Initialize the reporter."""
+    def __init__(self, streaming_path: Path | None = None) -> None:
+        """Initialize the reporter.
+        
+        Args:
+            streaming_path: Optional JSONL file to stream scenario results to
+        """
+        self.streaming_path = streaming_path
+        self._stream: IO[bytes] | None = None
         self._start_time: datetime | None = None
+        self._start_monotonic = 0.0
+        self._totals = _RunTotals()
         self._scenario_results: list[ScenarioResult] = []
-        self._current_scenario: str | None = None
-        self._current_tests: list[TestResult] = []
-        self._scenario_start: datetime | None = None
+        self._current: ContextVar[_ScenarioProgress | None] = ContextVar(
+            f"scenario_progress_{id(self)}",
+            default=None,
+        )
     
     def start_run(self) -> None:
         """Mark the start of a test run."""
         self._start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
+        self._totals = _RunTotals()
         self._scenario_results = []
+        if self.streaming_path is not None:
+            self._close_stream()
+            self._stream = open(self.streaming_path, "wb")
         logger.info("Test run started")
     
     def start_scenario(self, name: str) -> None:
@@ -79,10 +160,8 @@ class TestReporter:
         Args:
             name: Scenario name
         """
-        self._current_scenario = name
-        self._current_tests = []
-        self._scenario_start = datetime.now()
-        logger.info(f"Starting scenario: {name}")
+        self._current.set(_ScenarioProgress(name=name, started_at=time.monotonic()))
+        logger.info("Starting scenario: %s", name)
     
     def add_test_result(self, result: TestResult) -> None:
         """Add a test result.
@@ -90,12 +169,19 @@ class TestReporter:
         Args:
             result: Test result to add
         """
-        self._current_tests.append(result)
-        status = "PASS" if result.passed else ("SKIP" if result.skipped else "FAIL")
-        logger.info(f"  [{status}] {result.test_name} ({result.duration_ms:.0f}ms)")
+        current = self._current.get()
+        if current is None:
+            raise RuntimeError("No scenario in progress")
+        
+        current.tests.append(result)
+        if logger.isEnabledFor(logging.INFO):
+            status = "PASS" if result.passed else ("SKIP" if result.skipped else "FAIL")
+            logger.info(
+                "  [%s] %s (%.0fms)", status, result.test_name, result.duration_ms
+            )
         
         if not result.passed and not result.skipped and result.error:
-            logger.error(f"    Error: {result.error}")
+            logger.error("    Error: %s", result.error)
     
     def end_scenario(self) -> ScenarioResult:
         """Mark the end of a scenario and return results.
@@ -103,32 +189,57 @@ class TestReporter:
         Returns:
             Scenario result
         """
-        if not self._current_scenario or not self._scenario_start:
+        current = self._current.get()
+        if current is None:
             raise RuntimeError("No scenario in progress")
         
-        duration = (datetime.now() - self._scenario_start).total_seconds() * 1000
+        duration = (time.monotonic() - current.started_at) * 1000
         
-        passed = sum(1 for t in self._current_tests if t.passed)
-        failed = sum(1 for t in self._current_tests if not t.passed and not t.skipped)
-        skipped = sum(1 for t in self._current_tests if t.skipped)
+        passed = failed = skipped = 0
+        for test in current.tests:
+            if test.passed:
+                passed += 1
+            elif not test.skipped:
+                failed += 1
+            if test.skipped:
+                skipped += 1
         
         result = ScenarioResult(
-            name=self._current_scenario,
+            name=current.name,
             passed=failed == 0,
-            total_tests=len(self._current_tests),
+            total_tests=len(current.tests),
             passed_tests=passed,
             failed_tests=failed,
             skipped_tests=skipped,
             duration_ms=duration,
-            test_results=self._current_tests.copy(),
+            # The progress record is dropped below, so the list can be handed over
+            test_results=current.tests,
         )
         
-        self._scenario_results.append(result)
+        totals = self._totals
+        totals.scenarios += 1
+        totals.passed_scenarios += result.passed
+        totals.tests += result.total_tests
+        totals.passed_tests += passed
+        totals.failed_tests += failed
+        totals.skipped_tests += skipped
+        
+        # No await between here and the write, so concurrent tasks can't interleave
+        if self._stream is not None:
+            self._stream.write(_dump_json_line(result))
+            self._stream.flush()
+        else:
+            self._scenario_results.append(result)
+        self._current.set(None)
         
         status = "PASSED" if result.passed else "FAILED"
         logger.info(
-            f"Scenario '{result.name}' {status}: "
-            f"{passed}/{result.total_tests} passed, {skipped} skipped"
+            "Scenario '%s' %s: %d/%d passed, %d skipped",
+            result.name,
+            status,
+            passed,
+            result.total_tests,
+            skipped,
         )
         
         return result
@@ -142,24 +253,19 @@ class TestReporter:
         if not self._start_time:
             raise RuntimeError("Test run not started")
         
-        total_duration = (datetime.now() - self._start_time).total_seconds() * 1000
-        
-        total_tests = sum(s.total_tests for s in self._scenario_results)
-        passed_tests = sum(s.passed_tests for s in self._scenario_results)
-        failed_tests = sum(s.failed_tests for s in self._scenario_results)
-        skipped_tests = sum(s.skipped_tests for s in self._scenario_results)
-        
-        passed_scenarios = sum(1 for s in self._scenario_results if s.passed)
+        total_duration = (time.monotonic() - self._start_monotonic) * 1000
+        self._close_stream()
         
+        totals = self._totals
         report = TestReport(
             timestamp=self._start_time.isoformat(),
-            total_scenarios=len(self._scenario_results),
-            passed_scenarios=passed_scenarios,
-            failed_scenarios=len(self._scenario_results) - passed_scenarios,
-            total_tests=total_tests,
-            passed_tests=passed_tests,
-            failed_tests=failed_tests,
-            skipped_tests=skipped_tests,
+            total_scenarios=totals.scenarios,
+            passed_scenarios=totals.passed_scenarios,
+            failed_scenarios=totals.scenarios - totals.passed_scenarios,
+            total_tests=totals.tests,
+            passed_tests=totals.passed_tests,
+            failed_tests=totals.failed_tests,
+            skipped_tests=totals.skipped_tests,
             total_duration_ms=total_duration,
             scenario_results=self._scenario_results,
         )
@@ -167,13 +273,30 @@ class TestReporter:
         logger.info("=" * 60)
         logger.info("TEST RUN SUMMARY")
         logger.info("=" * 60)
-        logger.info(f"Scenarios: {passed_scenarios}/{report.total_scenarios} passed")
-        logger.info(f"Tests: {passed_tests}/{total_tests} passed, {skipped_tests} skipped")
-        logger.info(f"Duration: {total_duration:.0f}ms")
+        logger.info(
+            "Scenarios: %d/%d passed", totals.passed_scenarios, totals.scenarios
+        )
+        logger.info(
+            "Tests: %d/%d passed, %d skipped",
+            totals.passed_tests,
+            totals.tests,
+            totals.skipped_tests,
+        )
+        logger.info("Duration: %.0fms", total_duration)
         logger.info("=" * 60)
         
         return report
     
+    def close(self) -> None:
+        """Close the scenario stream file, e.g. after a failed run."""
+        self._close_stream()
+    
+    def _close_stream(self) -> None:
+        """Close the scenario stream file if it is open."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+    
     def save_report(
         self,
         report: TestReport,
@@ -188,15 +311,21 @@ class TestReporter:
             format: Output format ('json' or 'text')
         """
         if format == "json":
-            with open(output_path, "w") as f:
-                json.dump(asdict(report), f, indent=2)
+            if orjson is not None:
+                with open(output_path, "wb") as f:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, "w") as f:
+                    json.dump(report, f, indent=2, cls=_DataclassEncoder)
         elif format == "text":
             with open(output_path, "w") as f:
-                f.write(self._format_text_report(report))
+                for line in self._iter_text_report(report):
+                    f.write(line)
+                    f.write("\n")
         else:
             raise ValueError(f"Unknown format: {format}")
         
-        logger.info(f"Report saved to {output_path}")
+        logger.info("Report saved to %s", output_path)
     
     def _format_text_report(self, report: TestReport) -> str:
         """Format report as text.
@@ -207,7 +336,18 @@ class TestReporter:
         Returns:
             Formatted text report
         """
-        lines = [
+        return "\n".join(self._iter_text_report(report))
+    
+    def _iter_text_report(self, report: TestReport) -> Iterator[str]:
+        """Yield the lines of the text report.
+        
+        Args:
+            report: Report to format
+            
+        Yields:
+            Report lines without trailing newlines
+        """
+        yield from [
             "=" * 60,
             "TEST REPORT",
             f"Generated: {report.timestamp}",
@@ -230,21 +370,15 @@ class TestReporter:
         ]
         
         for scenario in report.scenario_results:
-            status = "PASSED" if scenario.passed else "FAILED"
-            lines.append(f"\nScenario: {scenario.name} [{status}]")
-            lines.append(f"  Tests: {scenario.passed_tests}/{scenario.total_tests} passed")
+            scenario_status = "PASSED" if scenario.passed else "FAILED"
+            yield f"\nScenario: {scenario.name} [{scenario_status}]"
+            yield f"  Tests: {scenario.passed_tests}/{scenario.total_tests} passed"
             
             for test in scenario.test_results:
-                if test.skipped:
-                    status = "SKIP"
-                elif test.passed:
-                    status = "PASS"
-                else:
-                    status = "FAIL"
-                lines.append(f"  [{status}] {test.test_name} ({test.duration_ms:.0f}ms)")
+                status = _TEXT_STATUS[(test.passed, test.skipped)]
+                yield f"  [{status}] {test.test_name} ({test.duration_ms:.0f}ms)"
                 
                 if test.error:
-                    lines.append(f"         Error: {test.error}")
+                    yield f"         Error: {test.error}"
         
-        lines.append("\n" + "=" * 60)
-        return "\n".join(lines)
+        yield "\n" + "=" * 60
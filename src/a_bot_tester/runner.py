@@ -2,16 +2,20 @@
 
 import argparse
 import asyncio
+import json
 import logging
 import sys
-from datetime import datetime
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from .client import BotTesterClient
+from .client import BotTesterClient, ClientPool
 from .config import Config
-from .reporter import TestReporter, TestResult
+from .ratelimit import TokenBucket
+from .reporter import TestReport, TestReporter, TestResult
 from .scenario import TestScenario, load_all_scenarios, load_scenario
-from .validator import create_validators_from_config
+from .validator import Validator, create_validators_from_config
 
 logger = logging.getLogger(__name__)
 
@@ -21,17 +25,23 @@ class TestRunner:
     
     def __init__(
         self,
-        client: BotTesterClient,
+        client: BotTesterClient | ClientPool,
         reporter: TestReporter | None = None,
+        max_concurrency: int = 1,
+        rate_limiter: TokenBucket | None = None,
     ) -> None:
         """Initialize the test runner.
         
         Args:
-            client: Telethon client wrapper
+            client: Telethon client wrapper, or a pool to lease one per scenario
             reporter: Optional test reporter
+            max_concurrency: Maximum number of scenarios to run at once
+            rate_limiter: Limiter pacing test commands (default: 5/s, burst 3)
         """
         self.client = client
         self.reporter = reporter or TestReporter()
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter or TokenBucket(rate=5.0, burst=3)
     
     async def run_scenario(self, scenario: TestScenario) -> None:
         """Run a single test scenario.
@@ -41,32 +51,53 @@ class TestRunner:
         """
         self.reporter.start_scenario(scenario.name)
         
-        # Run setup commands
-        for cmd in scenario.setup_commands:
-            logger.info(f"Running setup command: {cmd}")
-            await self.client.send_command(cmd, timeout=5)
-            await asyncio.sleep(1)
-        
-        # Run tests
-        for test in scenario.tests:
-            result = await self._run_test(test, scenario.name)
-            self.reporter.add_test_result(result)
-            await asyncio.sleep(0.5)  # Small delay between tests
-        
-        # Run teardown commands
-        for cmd in scenario.teardown_commands:
-            logger.info(f"Running teardown command: {cmd}")
-            await self.client.send_command(cmd, timeout=5)
-            await asyncio.sleep(1)
+        async with self._lease_client() as client:
+            # Run setup commands
+            if scenario.setup_commands:
+                logger.info("Running setup commands: %s", scenario.setup_commands)
+                await client.send_commands_chain(scenario.setup_commands, timeout=5)
+            
+            # Run tests, building validators once per distinct expected config
+            validator_cache: dict[str, list[Validator]] = {}
+            for test in scenario.tests:
+                if not test.skip:
+                    await self.rate_limiter.acquire()
+                result = await self._run_test(
+                    client, test, scenario.name, validator_cache
+                )
+                self.reporter.add_test_result(result)
+            
+            # Run teardown commands
+            if scenario.teardown_commands:
+                logger.info("Running teardown commands: %s", scenario.teardown_commands)
+                await client.send_commands_chain(scenario.teardown_commands, timeout=5)
         
         self.reporter.end_scenario()
     
-    async def _run_test(self, test: "TestCase", scenario_name: str) -> TestResult:
+    @asynccontextmanager
+    async def _lease_client(self) -> AsyncIterator[BotTesterClient]:
+        """Get a client for one scenario, leasing it from the pool if there is one."""
+        if isinstance(self.client, ClientPool):
+            async with self.client.lease() as client:
+                yield client
+        else:
+            yield self.client
+    
+    async def _run_test(
+        self,
+        client: BotTesterClient,
+        test: "TestCase",
+        scenario_name: str,
+        validator_cache: dict[str, list[Validator]] | None = None,
+    ) -> TestResult:
         """Run a single test case.
         
         Args:
+            client: Client to send the test command with
             test: Test case to run
             scenario_name: Name of the parent scenario
+            validator_cache: Validators already built for this scenario,
+                keyed by their serialized config
             
         Returns:
             Test result
@@ -84,17 +115,24 @@ class TestRunner:
                 skip_reason=test.skip_reason,
             )
         
-        start_time = datetime.now()
+        start_time = time.monotonic()
         
         try:
             # Send command and get responses
-            responses = await self.client.send_command(
+            responses = await client.send_command(
                 test.command,
                 timeout=test.timeout,
             )
             
             # Validate responses
-            validators = create_validators_from_config(test.expected)
+            if validator_cache is None:
+                validators = create_validators_from_config(test.expected)
+            else:
+                key = json.dumps(test.expected, sort_keys=True, default=str)
+                validators = validator_cache.get(key)
+                if validators is None:
+                    validators = create_validators_from_config(test.expected)
+                    validator_cache[key] = validators
             validation_results = []
             all_passed = True
             
@@ -114,6 +152,8 @@ class TestRunner:
                     })
                     if not result.passed:
                         all_passed = False
+                        if test.fail_fast:
+                            break
             
             # Create response preview
             response_preview = None
@@ -124,7 +164,7 @@ class TestRunner:
                         preview_parts.append(msg.text[:100])
                 response_preview = " | ".join(preview_parts)
             
-            duration = (datetime.now() - start_time).total_seconds() * 1000
+            duration = (time.monotonic() - start_time) * 1000
             
             return TestResult(
                 test_name=test.name,
@@ -137,8 +177,8 @@ class TestRunner:
             )
             
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds() * 1000
-            logger.exception(f"Error running test '{test.name}'")
+            duration = (time.monotonic() - start_time) * 1000
+            logger.exception("Error running test '%s'", test.name)
             
             return TestResult(
                 test_name=test.name,
@@ -149,18 +189,43 @@ class TestRunner:
                 error=str(e),
             )
     
-    async def run_all(self, scenarios: list[TestScenario]) -> None:
+    async def run_all(self, scenarios: list[TestScenario]) -> TestReport:
         """Run all test scenarios.
         
         Args:
             scenarios: List of scenarios to run
+            
+        Returns:
+            Final test report
         """
         self.reporter.start_run()
         
-        for scenario in scenarios:
-            await self.run_scenario(scenario)
+        try:
+            # Tests inside a scenario share bot state and stay sequential;
+            # independent scenarios are fanned out up to max_concurrency.
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            await asyncio.gather(
+                *(self._run_guarded(semaphore, scenario) for scenario in scenarios)
+            )
+            
+            return self.reporter.generate_report()
+        finally:
+            # The report closes the stream, but a failed run never gets there
+            self.reporter.close()
+    
+    async def _run_guarded(
+        self,
+        semaphore: asyncio.Semaphore,
+        scenario: TestScenario,
+    ) -> None:
+        """Run a scenario once a concurrency slot is available.
         
-        self.reporter.generate_report()
+        Args:
+            semaphore: Semaphore bounding concurrent scenarios
+            scenario: Scenario to run
+        """
+        async with semaphore:
+            await self.run_scenario(scenario)
 
 
 async def main() -> int:
@@ -189,6 +254,11 @@ async def main() -> int:
         default="json",
         help="Report format (default: json)",
     )
+    parser.add_argument(
+        "--stream",
+        help="JSONL file to write each scenario result to as it finishes "
+        "(overwritten on each run)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -208,20 +278,20 @@ async def main() -> int:
     try:
         config = Config.from_env()
     except ValueError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         return 1
     
     # Load scenarios
     if args.scenario:
         scenario_path = Path(args.scenario)
         if not scenario_path.exists():
-            logger.error(f"Scenario file not found: {scenario_path}")
+            logger.error("Scenario file not found: %s", scenario_path)
             return 1
         scenarios = [load_scenario(scenario_path)]
     else:
         scenarios_dir = Path(args.scenarios_dir)
         if not scenarios_dir.exists():
-            logger.error(f"Scenarios directory not found: {scenarios_dir}")
+            logger.error("Scenarios directory not found: %s", scenarios_dir)
             return 1
         scenarios = load_all_scenarios(scenarios_dir)
     
@@ -229,22 +299,25 @@ async def main() -> int:
         logger.error("No scenarios found to run")
         return 1
     
-    logger.info(f"Loaded {len(scenarios)} scenario(s)")
+    logger.info("Loaded %d scenario(s)", len(scenarios))
     
     # Run tests
-    reporter = TestReporter()
+    reporter = TestReporter(Path(args.stream) if args.stream else None)
     
-    async with BotTesterClient(config) as client:
-        runner = TestRunner(client, reporter)
-        await runner.run_all(scenarios)
+    async with ClientPool(config, size=config.pool_size) as pool:
+        runner = TestRunner(
+            pool,
+            reporter,
+            max_concurrency=config.max_concurrency,
+            rate_limiter=TokenBucket(config.send_rate, config.send_burst),
+        )
+        report = await runner.run_all(scenarios)
     
     # Save report
     if args.output:
-        report = reporter.generate_report()
         reporter.save_report(report, Path(args.output), args.format)
     
     # Return exit code based on results
-    report = reporter.generate_report()
     return 0 if report.failed_tests == 0 else 1
 
 
@@ -1,6 +1,12 @@
 """Test scenario loading and management."""
 
+import hashlib
 import logging
+import os
+import pickle
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -9,21 +15,34 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# LibYAML's C loader is much faster; fall back to pure Python if unavailable
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+SCENARIO_SUFFIXES = (".yaml", ".yml")
+
+# Response timeout (seconds) for tests that don't set one
+DEFAULT_TEST_TIMEOUT = 10
+
+SCENARIO_CACHE_DIR = Path.home() / ".cache" / "a_bot_tester" / "scenarios"
+# Bump when TestCase/TestScenario change shape so stale pickles are ignored
+SCENARIO_CACHE_VERSION = 2
+
+
+@dataclass(slots=True)
 class TestCase:
     """A single test case."""
     
     name: str
     command: str
     expected: list[dict[str, Any]] = field(default_factory=list)
-    timeout: int = 10
+    timeout: int = DEFAULT_TEST_TIMEOUT
     description: str = ""
     skip: bool = False
     skip_reason: str = ""
+    fail_fast: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TestScenario:
     """A test scenario containing multiple test cases."""
     
@@ -37,29 +56,65 @@ class TestScenario:
 def load_scenario(path: Path) -> TestScenario:
     """Load a test scenario from a YAML file.
     
+    Parsed scenarios are cached on disk keyed by the file's modification
+    time and size, so unchanged files skip YAML parsing on later runs.
+    
     Args:
         path: Path to the YAML file
         
     Returns:
         TestScenario instance
     """
-    with open(path) as f:
-        data = yaml.safe_load(f)
+    stat = path.stat()
+    key = (SCENARIO_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+    cache_path = _scenario_cache_path(path)
     
+    scenario = _load_cached_scenario(cache_path, key)
+    if scenario is None:
+        scenario = _parse_scenario(path)
+        _store_cached_scenario(cache_path, key, scenario)
+    return scenario
+
+
+def _parse_scenario(path: Path) -> TestScenario:
+    """Parse a test scenario from a YAML file.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        TestScenario instance
+    """
+    # One read of the whole (small) file; LibYAML detects the encoding from bytes
+    data = yaml.load(path.read_bytes(), Loader=_Loader)
+    return _build_scenario(data, path.stem)
+
+
+def _build_scenario(data: dict[str, Any], default_name: str) -> TestScenario:
+    """Build a test scenario from parsed YAML data.
+    
+    Args:
+        data: Parsed scenario document
+        default_name: Name to use if the document doesn't set one
+        
+    Returns:
+        TestScenario instance
+    """
     tests = []
     for test_data in data.get("tests", []):
         tests.append(TestCase(
             name=test_data["name"],
             command=test_data["command"],
             expected=test_data.get("expected", []),
-            timeout=test_data.get("timeout", 10),
+            timeout=test_data.get("timeout", DEFAULT_TEST_TIMEOUT),
             description=test_data.get("description", ""),
             skip=test_data.get("skip", False),
             skip_reason=test_data.get("skip_reason", ""),
+            fail_fast=test_data.get("fail_fast", False),
         ))
     
     return TestScenario(
-        name=data.get("name", path.stem),
+        name=data.get("name", default_name),
         description=data.get("description", ""),
         setup_commands=data.get("setup_commands", []),
         teardown_commands=data.get("teardown_commands", []),
@@ -67,31 +122,106 @@ def load_scenario(path: Path) -> TestScenario:
     )
 
 
+def iter_scenarios(path: Path) -> Iterator[TestScenario]:
+    """Lazily load the scenarios of a multi-document YAML file.
+    
+    Documents are parsed one at a time as the iterator advances, so the
+    file's scenarios are never all held in memory. Empty documents are
+    skipped. Results are not cached.
+    
+    Args:
+        path: Path to a YAML file with ``---``-separated scenarios
+        
+    Yields:
+        TestScenario instances in file order; unnamed ones are called
+        ``<file stem>-<document index>``
+    """
+    with open(path, "rb") as f:
+        for index, data in enumerate(yaml.load_all(f, Loader=_Loader)):
+            if data is not None:
+                yield _build_scenario(data, f"{path.stem}-{index}")
+
+
+def _scenario_cache_path(path: Path) -> Path:
+    """Get the cache file for a scenario file."""
+    digest = hashlib.sha1(str(path.resolve()).encode()).hexdigest()
+    return SCENARIO_CACHE_DIR / f"{digest}.pickle"
+
+
+def _load_cached_scenario(
+    cache_path: Path,
+    key: tuple[int, int, int],
+) -> TestScenario | None:
+    """Load a cached scenario if it was stored for the same file version."""
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, scenario = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable scenario cache %s: %s", cache_path, e)
+        return None
+    
+    return scenario if cached_key == key else None
+
+
+def _store_cached_scenario(
+    cache_path: Path,
+    key: tuple[int, int, int],
+    scenario: TestScenario,
+) -> None:
+    """Write a parsed scenario to the cache, replacing the file atomically."""
+    tmp_path = cache_path.with_name(
+        f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(pickle.dumps((key, scenario), pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Failed to write scenario cache %s: %s", cache_path, e)
+
+
+def _try_load_scenario(path: Path) -> TestScenario | None:
+    """Load a scenario file, logging and swallowing any error.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        TestScenario instance, or None if the file could not be loaded
+    """
+    try:
+        scenario = load_scenario(path)
+    except Exception as e:
+        logger.error("Failed to load scenario from %s: %s", path, e)
+        return None
+    
+    logger.info("Loaded scenario: %s (%d tests)", scenario.name, len(scenario.tests))
+    return scenario
+
+
 def load_all_scenarios(directory: Path) -> list[TestScenario]:
     """Load all test scenarios from a directory.
     
+    ``*.yaml`` and ``*.yml`` files are read and parsed on a thread pool;
+    the result is ordered by file name.
+    
     Args:
         directory: Path to the scenarios directory
         
     Returns:
         List of TestScenario instances
     """
-    scenarios = []
-    
-    for yaml_file in directory.glob("*.yaml"):
-        try:
-            scenario = load_scenario(yaml_file)
-            scenarios.append(scenario)
-            logger.info(f"Loaded scenario: {scenario.name} ({len(scenario.tests)} tests)")
-        except Exception as e:
-            logger.error(f"Failed to load scenario from {yaml_file}: {e}")
-    
-    for yml_file in directory.glob("*.yml"):
-        try:
-            scenario = load_scenario(yml_file)
-            scenarios.append(scenario)
-            logger.info(f"Loaded scenario: {scenario.name} ({len(scenario.tests)} tests)")
-        except Exception as e:
-            logger.error(f"Failed to load scenario from {yml_file}: {e}")
-    
-    return scenarios
+    paths = sorted(
+        path for path in directory.iterdir()
+        if path.suffix in SCENARIO_SUFFIXES and path.is_file()
+    )
+    if not paths:
+        return []
+    
+    # Loading is mostly file I/O, so allow more threads than cores
+    max_workers = min(len(paths), 32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        scenarios = executor.map(_try_load_scenario, paths)
+        return [scenario for scenario in scenarios if scenario is not None]
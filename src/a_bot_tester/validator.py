@@ -1,17 +1,46 @@
 """Response validators for bot testing."""
 
+import functools
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
 from telethon.tl.types import Message
 
+try:
+    import ahocorasick
+except ImportError:  # optional: contains checks then run one validator each
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Fuse contains checks into one scan once a test has at least this many
+_FUSE_MIN_CONTAINS = 3
+
+
+@functools.lru_cache(maxsize=512)
+def _compile(pattern: str, flags: int) -> re.Pattern[str]:
+    """Compile a regex, reusing the result for repeated (pattern, flags) pairs.
+    
+    Unlike ``re``'s internal cache, this one is not flushed wholesale when
+    many distinct patterns are used.
+    """
+    return re.compile(pattern, flags)
+
 
-@dataclass
+def _as_list(response: Message | list[Message]) -> list[Message]:
+    """Normalize a single message or a list of messages to a list.
+    
+    Checks for ``list`` rather than Telethon's ``Message``: responses from
+    the client are plain lists, and the cheap check is taken first.
+    """
+    return response if isinstance(response, list) else [response]
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of a validation check."""
     
@@ -48,21 +77,26 @@ class ContainsTextValidator(Validator):
         """
         self.text = text
         self.case_sensitive = case_sensitive
+        self._search_text = text if case_sensitive else text.lower()
     
     def validate(self, response: Message | list[Message]) -> ValidationResult:
         """Check if response contains the expected text."""
-        messages = [response] if isinstance(response, Message) else response
+        messages = _as_list(response)
         
-        search_text = self.text if self.case_sensitive else self.text.lower()
+        search_text = self._search_text
+        case_sensitive = self.case_sensitive
         
         for msg in messages:
-            if msg.text:
-                msg_text = msg.text if self.case_sensitive else msg.text.lower()
-                if search_text in msg_text:
-                    return ValidationResult(
-                        passed=True,
-                        message=f"Found text '{self.text}' in response",
-                    )
+            msg_text = msg.text
+            if not msg_text:
+                continue
+            if not case_sensitive:
+                msg_text = msg_text.lower()
+            if search_text in msg_text:
+                return ValidationResult(
+                    passed=True,
+                    message=f"Found text '{self.text}' in response",
+                )
         
         return ValidationResult(
             passed=False,
@@ -71,6 +105,66 @@ class ContainsTextValidator(Validator):
         )
 
 
+class FusedContainsValidator(Validator):
+    """Validator that checks for several texts in a single pass.
+    
+    Uses an Aho-Corasick automaton, so each message is scanned once no
+    matter how many texts are expected. Requires ``pyahocorasick``.
+    """
+    
+    def __init__(self, texts: list[str], case_sensitive: bool = False) -> None:
+        """Initialize the validator.
+        
+        Args:
+            texts: Non-empty texts that must all appear in the response
+            case_sensitive: Whether to perform case-sensitive search
+        """
+        self.texts = texts
+        self.case_sensitive = case_sensitive
+        
+        # Texts that differ only in case share a search key, so each key maps
+        # to all of the texts it stands for
+        originals: dict[str, list[str]] = {}
+        for text in dict.fromkeys(texts):
+            search_text = text if case_sensitive else text.lower()
+            originals.setdefault(search_text, []).append(text)
+        
+        self._automaton = ahocorasick.Automaton()
+        for search_text, found in originals.items():
+            self._automaton.add_word(search_text, tuple(found))
+        self._automaton.make_automaton()
+    
+    def validate(self, response: Message | list[Message]) -> ValidationResult:
+        """Check if response contains all of the expected texts."""
+        messages = _as_list(response)
+        
+        missing = set(self.texts)
+        for msg in messages:
+            msg_text = msg.text
+            if not msg_text:
+                continue
+            if not self.case_sensitive:
+                msg_text = msg_text.lower()
+            for _, found in self._automaton.iter(msg_text):
+                missing.difference_update(found)
+            if not missing:
+                return ValidationResult(
+                    passed=True,
+                    message=f"Found all {len(self.texts)} texts in response",
+                )
+        
+        not_found = [text for text in self.texts if text in missing]
+        return ValidationResult(
+            passed=False,
+            message=f"Texts not found in response: {not_found}",
+            details={
+                "expected": self.texts,
+                "missing": not_found,
+                "got": [m.text for m in messages if m.text],
+            },
+        )
+
+
 class MatchesPatternValidator(Validator):
     """Validator that checks if response matches a regex pattern."""
     
@@ -81,11 +175,11 @@ class MatchesPatternValidator(Validator):
             pattern: Regex pattern to match
             flags: Regex flags
         """
-        self.pattern = re.compile(pattern, flags)
+        self.pattern = _compile(pattern, flags)
     
     def validate(self, response: Message | list[Message]) -> ValidationResult:
         """Check if response matches the pattern."""
-        messages = [response] if isinstance(response, Message) else response
+        messages = _as_list(response)
         
         for msg in messages:
             if msg.text and self.pattern.search(msg.text):
@@ -101,6 +195,11 @@ class MatchesPatternValidator(Validator):
         )
 
 
+def _button_texts(msg: Message) -> list[str]:
+    """List the texts of all inline buttons of a message, row by row."""
+    return [btn.text for row in msg.buttons for btn in row]
+
+
 class HasButtonsValidator(Validator):
     """Validator that checks if response has inline buttons."""
     
@@ -120,36 +219,41 @@ class HasButtonsValidator(Validator):
     
     def validate(self, response: Message | list[Message]) -> ValidationResult:
         """Check if response has expected buttons."""
-        messages = [response] if isinstance(response, Message) else response
+        messages = _as_list(response)
         
         for msg in messages:
             if msg.buttons:
-                # Flatten button list
-                all_buttons = [btn for row in msg.buttons for btn in row]
-                button_texts = [btn.text for btn in all_buttons]
+                button_count = sum(len(row) for row in msg.buttons)
                 
                 # Check minimum buttons
-                if self.min_buttons and len(all_buttons) < self.min_buttons:
+                if self.min_buttons and button_count < self.min_buttons:
                     return ValidationResult(
                         passed=False,
-                        message=f"Expected at least {self.min_buttons} buttons, got {len(all_buttons)}",
-                        details={"expected_min": self.min_buttons, "got": len(all_buttons)},
+                        message=(
+                            f"Expected at least {self.min_buttons} buttons, "
+                            f"got {button_count}"
+                        ),
+                        details={"expected_min": self.min_buttons, "got": button_count},
                     )
                 
                 # Check specific button texts
                 if self.button_texts:
-                    missing = [t for t in self.button_texts if t not in button_texts]
+                    present = {btn.text for row in msg.buttons for btn in row}
+                    missing = [t for t in self.button_texts if t not in present]
                     if missing:
                         return ValidationResult(
                             passed=False,
                             message=f"Missing expected buttons: {missing}",
-                            details={"expected": self.button_texts, "found": button_texts},
+                            details={
+                                "expected": self.button_texts,
+                                "found": _button_texts(msg),
+                            },
                         )
                 
                 return ValidationResult(
                     passed=True,
-                    message=f"Found {len(all_buttons)} button(s)",
-                    details={"buttons": button_texts},
+                    message=f"Found {button_count} button(s)",
+                    details={"buttons": _button_texts(msg)},
                 )
         
         return ValidationResult(
@@ -180,7 +284,7 @@ class ResponseCountValidator(Validator):
     
     def validate(self, response: Message | list[Message]) -> ValidationResult:
         """Check response count."""
-        messages = [response] if isinstance(response, Message) else response
+        messages = _as_list(response)
         count = len(messages)
         
         if self.exact_count is not None and count != self.exact_count:
@@ -212,7 +316,7 @@ class NotEmptyValidator(Validator):
     
     def validate(self, response: Message | list[Message]) -> ValidationResult:
         """Check if response has content."""
-        messages = [response] if isinstance(response, Message) else response
+        messages = _as_list(response)
         
         if not messages:
             return ValidationResult(
@@ -233,6 +337,42 @@ class NotEmptyValidator(Validator):
         )
 
 
+# Validator factories keyed by the config key that selects them, in order
+# of precedence
+_VALIDATOR_FACTORIES: dict[str, Callable[[dict[str, Any]], Validator]] = {
+    "contains": lambda item: ContainsTextValidator(
+        item["contains"],
+        item.get("case_sensitive", False),
+    ),
+    "matches": lambda item: MatchesPatternValidator(
+        item["matches"],
+        item.get("flags", 0),
+    ),
+    "has_buttons": lambda item: HasButtonsValidator(
+        button_texts=item.get("button_texts"),
+        min_buttons=item.get("min_buttons"),
+    ),
+    "response_count": lambda item: ResponseCountValidator(
+        min_count=item.get("min"),
+        max_count=item.get("max"),
+        exact_count=item.get("exact"),
+    ),
+    "not_empty": lambda item: NotEmptyValidator(),
+}
+
+
+def _validator_kind(item: dict[str, Any]) -> str | None:
+    """Get the config key selecting the validator for an item.
+    
+    If an item names several validators, the table order decides: contains,
+    matches, has_buttons, response_count, then not_empty.
+    """
+    for key in _VALIDATOR_FACTORIES:
+        if key in item:
+            return key
+    return None
+
+
 def create_validators_from_config(config: list[dict[str, Any]]) -> list[Validator]:
     """Create validator instances from configuration.
     
@@ -243,30 +383,32 @@ def create_validators_from_config(config: list[dict[str, Any]]) -> list[Validato
         List of Validator instances
     """
     validators: list[Validator] = []
+    kinds = [_validator_kind(item) for item in config]
+    
+    # Group non-empty contains checks by case sensitivity; large groups are
+    # fused into one validator placed where the group's first check was.
+    fused: dict[bool, FusedContainsValidator | None] = {}
+    if ahocorasick is not None:
+        groups: dict[bool, list[str]] = {}
+        for item, kind in zip(config, kinds):
+            if kind == "contains" and item["contains"]:
+                case_sensitive = bool(item.get("case_sensitive", False))
+                groups.setdefault(case_sensitive, []).append(item["contains"])
+        for case_sensitive, texts in groups.items():
+            if len(texts) >= _FUSE_MIN_CONTAINS:
+                fused[case_sensitive] = FusedContainsValidator(texts, case_sensitive)
     
-    for item in config:
-        if "contains" in item:
-            validators.append(ContainsTextValidator(
-                item["contains"],
-                item.get("case_sensitive", False),
-            ))
-        elif "matches" in item:
-            validators.append(MatchesPatternValidator(
-                item["matches"],
-                item.get("flags", 0),
-            ))
-        elif "has_buttons" in item:
-            validators.append(HasButtonsValidator(
-                button_texts=item.get("button_texts"),
-                min_buttons=item.get("min_buttons"),
-            ))
-        elif "response_count" in item:
-            validators.append(ResponseCountValidator(
-                min_count=item.get("min"),
-                max_count=item.get("max"),
-                exact_count=item.get("exact"),
-            ))
-        elif "not_empty" in item:
-            validators.append(NotEmptyValidator())
+    for item, kind in zip(config, kinds):
+        if kind is None:
+            continue
+        if kind == "contains" and item["contains"]:
+            case_sensitive = bool(item.get("case_sensitive", False))
+            if case_sensitive in fused:
+                group = fused[case_sensitive]
+                if group is not None:
+                    validators.append(group)
+                    fused[case_sensitive] = None
+                continue
+        validators.append(_VALIDATOR_FACTORIES[kind](item))
     
     return validators
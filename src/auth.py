@@ -2,21 +2,27 @@
 Authentication helper for first-time setup.
 """
 
+import argparse
 import asyncio
 
 from telethon import TelegramClient
 from rich.console import Console
 from rich.prompt import Prompt
 
+from .client import save_bot_peer
 from .config import get_settings
 from .utils.logging import setup_logging, get_logger
 
 logger = get_logger(__name__)
 
 
-async def authenticate() -> None:
+async def authenticate(extra: int = 0) -> None:
     """
     Authenticate with Telegram and create session.
+
+    Args:
+        extra: Number n of the extra --parallel session to log in instead:
+            '<session_name>_<n>', with the phone EXTRA_PHONES[n - 1].
     """
     console = Console()
     setup_logging("INFO")
@@ -24,6 +30,19 @@ async def authenticate() -> None:
     console.print("\n[bold cyan]🔐 Telegram Authentication Setup[/bold cyan]\n")
 
     settings = get_settings()
+    if extra:
+        if len(settings.extra_phones) < extra:
+            console.print(
+                f"[bold red]❌ EXTRA_PHONES has no phone for extra session {extra}"
+                "[/bold red]"
+            )
+            return
+        settings = settings.model_copy(
+            update={
+                "session_name": f"{settings.session_name}_{extra}",
+                "telegram_phone": settings.extra_phones[extra - 1],
+            }
+        )
 
     console.print(f"Session name: [cyan]{settings.session_name}[/cyan]")
     console.print(f"Phone: [cyan]{settings.telegram_phone}[/cyan]")
@@ -46,6 +65,7 @@ async def authenticate() -> None:
     # Verify bot access
     try:
         bot = await client.get_entity(settings.target_bot_username)
+        save_bot_peer(settings, bot)
         console.print(f"\n[bold green]✅ Bot found:[/bold green]")
         console.print(f"   Username: @{bot.username}")
         console.print(f"   ID: {bot.id}")
@@ -58,12 +78,25 @@ async def authenticate() -> None:
 
     console.print(f"\n[bold green]✅ Session saved to '{settings.session_name}.session'[/bold green]")
     console.print("\nYou can now run tests with:")
-    console.print(f"  [cyan]python -m src.main[/cyan]")
+    if extra:
+        console.print("  [cyan]python -m src.main --parallel[/cyan]")
+    else:
+        console.print("  [cyan]python -m src.main[/cyan]")
 
 
 def main() -> None:
     """Entry point for authentication."""
-    asyncio.run(authenticate())
+    parser = argparse.ArgumentParser(description="Log in a Telegram session")
+    parser.add_argument(
+        "--extra",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Log in extra --parallel session N with the N-th EXTRA_PHONES number",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(authenticate(args.extra))
 
 
 if __name__ == "__main__":
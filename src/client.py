@@ -3,11 +3,16 @@ Telethon client wrapper for bot testing.
 """
 
 import asyncio
-from datetime import datetime
-from typing import Any, Callable, Coroutine
-
-from telethon import TelegramClient
+import json
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Coroutine, TypeVar
+
+from telethon import TelegramClient, events
+from telethon.errors import PeerIdInvalidError, UserIdInvalidError
 from telethon.tl.types import (
+    InputPeerUser,
     Message,
     ReplyInlineMarkup,
     KeyboardButtonCallback,
@@ -20,6 +25,114 @@ from .utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+@dataclass
+class _FlatButtons:
+    """Flattened view of the callback buttons in an inline keyboard."""
+
+    buttons: list[tuple[int, int, KeyboardButtonCallback]] = field(
+        default_factory=list
+    )
+    lowered_texts: list[str] = field(default_factory=list)
+    decoded_data: list[str | None] = field(default_factory=list)
+    positions: dict[tuple[int, int], KeyboardButtonCallback] = field(
+        default_factory=dict
+    )
+    by_text: dict[str, KeyboardButtonCallback] = field(default_factory=dict)
+    by_data: dict[bytes, KeyboardButtonCallback] = field(default_factory=dict)
+
+
+# Keyed by id() of the keyboard markup: Telethon objects define __eq__ and
+# so aren't hashable. Entries are dropped when the markup is collected.
+_button_cache: dict[int, _FlatButtons] = {}
+
+
+def _flatten(message: Message) -> _FlatButtons:
+    """
+    Get the callback buttons of a message, walking its keyboard only once.
+
+    Args:
+        message: Message to read buttons from.
+
+    Returns:
+        Flattened buttons (empty if the message has no inline keyboard).
+    """
+    markup = message.reply_markup
+    if not isinstance(markup, ReplyInlineMarkup):
+        return _FlatButtons()
+
+    key = id(markup)
+    flat = _button_cache.get(key)
+    if flat is not None:
+        return flat
+
+    flat = _FlatButtons()
+    for row_idx, row in enumerate(markup.rows):
+        for col_idx, button in enumerate(row.buttons):
+            if isinstance(button, KeyboardButtonCallback):
+                flat.buttons.append((row_idx, col_idx, button))
+                flat.lowered_texts.append(button.text.lower())
+                flat.decoded_data.append(
+                    button.data.decode() if button.data else None
+                )
+                flat.positions[row_idx, col_idx] = button
+                # First button wins, as with a linear scan
+                flat.by_text.setdefault(button.text, button)
+                if button.data:
+                    flat.by_data.setdefault(button.data, button)
+
+    _button_cache[key] = flat
+    weakref.finalize(markup, _button_cache.pop, key, None)
+    return flat
+
+
+def _bot_peer_path(settings: Settings) -> Path:
+    """Get the sidecar file caching the resolved bot, next to the session."""
+    return Path(f"{settings.session_name}.bot.json")
+
+
+def load_bot_peer(settings: Settings) -> InputPeerUser | None:
+    """
+    Load the target bot resolved by a previous run.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        Input peer for the bot, or None if it isn't cached.
+    """
+    path = _bot_peer_path(settings)
+    try:
+        data = json.loads(path.read_text())
+        if data["username"] != settings.target_bot_username:
+            return None
+        return InputPeerUser(user_id=data["id"], access_hash=data["access_hash"])
+    except (OSError, ValueError, KeyError) as e:
+        logger.debug("Bot peer not cached", path=str(path), error=str(e))
+        return None
+
+
+def save_bot_peer(settings: Settings, bot: User) -> None:
+    """
+    Cache the resolved target bot so later runs skip the username lookup.
+
+    Args:
+        settings: Application settings.
+        bot: Resolved bot user.
+    """
+    path = _bot_peer_path(settings)
+    data = {
+        "username": settings.target_bot_username,
+        "id": bot.id,
+        "access_hash": bot.access_hash,
+    }
+    try:
+        path.write_text(json.dumps(data))
+    except OSError as e:
+        logger.warning("Failed to cache bot peer", path=str(path), error=str(e))
+
 
 class BotTesterClient:
     """
@@ -29,6 +142,9 @@ class BotTesterClient:
     and validating responses.
     """
 
+    # Replies come from the bot (see ReplayClient for recorded ones)
+    replaying = False
+
     def __init__(self, settings: Settings) -> None:
         """
         Initialize the tester client.
@@ -42,26 +158,113 @@ class BotTesterClient:
             settings.telegram_api_id,
             settings.telegram_api_hash,
         )
-        self._bot_entity: User | None = None
+        self._bot_entity: User | InputPeerUser | None = None
+        # The bot peer came from the cache and no request has confirmed it yet
+        self._peer_unconfirmed = False
         self._last_message: Message | None = None
+        # Lowercased text of the last message, and the message it is for
+        self._lower_text: tuple[Message | None, str] = (None, "")
+        self._incoming: asyncio.Queue[Message] = asyncio.Queue()
+        # Commands, messages and button clicks sent so far
+        self.requests_sent = 0
+        # Free-text messages sent so far; each may change the conversation
+        # state, so command replies received before it can't be reused
+        self.state_changes = 0
+        # Replies received since begin_test()
+        self._recorded: list[dict[str, Any] | None] = []
+
+    async def start(self, login: bool = True) -> None:
+        """
+        Start the client and authenticate if needed.
 
-    async def start(self) -> None:
-        """Start the client and authenticate if needed."""
+        Args:
+            login: Prompt for a login code if the session isn't logged in;
+                otherwise fail.
+
+        Raises:
+            RuntimeError: If login is False and the session isn't logged in.
+        """
+        if not login:
+            await self.client.connect()
+            if not await self.client.is_user_authorized():
+                await self.client.disconnect()
+                raise RuntimeError(
+                    f"Session '{self.settings.session_name}' is not logged in"
+                )
         await self.client.start(phone=self.settings.telegram_phone)
         logger.info("Client started successfully")
 
-        # Resolve bot entity
-        self._bot_entity = await self.client.get_entity(
-            self.settings.target_bot_username
-        )
+        # Resolve bot entity, reusing the peer cached by an earlier run
+        peer = load_bot_peer(self.settings)
+        if peer is not None:
+            self._bot_entity = peer
+            self._peer_unconfirmed = True
+            bot_id = peer.user_id
+        else:
+            bot_id = await self._resolve_bot()
         logger.info(
             "Bot resolved",
             bot_username=self.settings.target_bot_username,
-            bot_id=self._bot_entity.id,
+            bot_id=bot_id,
+            cached=peer is not None,
         )
 
+        # Bot replies and edits (e.g. after a button click) are pushed to us
+        self.client.add_event_handler(
+            self._on_bot_message, events.NewMessage(from_users=self._bot_entity)
+        )
+        self.client.add_event_handler(
+            self._on_bot_message, events.MessageEdited(from_users=self._bot_entity)
+        )
+
+    async def account_id(self) -> int:
+        """Get the ID of the account the session is logged in to."""
+        me = await self.client.get_me(input_peer=True)
+        return me.user_id
+
+    async def _resolve_bot(self) -> int:
+        """
+        Resolve the bot's username and cache the peer for later runs.
+
+        Returns:
+            Bot's user ID.
+        """
+        bot = await self.client.get_entity(self.settings.target_bot_username)
+        save_bot_peer(self.settings, bot)
+        self._bot_entity = bot
+        return bot.id
+
+    async def _to_bot(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a request addressed to the bot.
+
+        If the first one finds the cached bot peer invalid (e.g. the session
+        was logged in to another account since), the cache is deleted, the
+        username resolved again and the request retried.
+
+        Args:
+            call: Returns the request's awaitable; reads self._bot_entity.
+
+        Returns:
+            Result of the request.
+        """
+        unconfirmed, self._peer_unconfirmed = self._peer_unconfirmed, False
+        try:
+            return await call()
+        except (PeerIdInvalidError, UserIdInvalidError):
+            if not unconfirmed:
+                raise
+            path = _bot_peer_path(self.settings)
+            logger.warning(
+                "Cached bot peer is invalid, resolving again", path=str(path)
+            )
+            path.unlink(missing_ok=True)
+            await self._resolve_bot()
+            return await call()
+
     async def stop(self) -> None:
         """Stop the client."""
+        self.client.remove_event_handler(self._on_bot_message)
         await self.client.disconnect()
         logger.info("Client disconnected")
 
@@ -90,16 +293,17 @@ class BotTesterClient:
         logger.debug("Sending command", command=command)
 
         # Send the command
-        await self.client.send_message(self._bot_entity, command)
+        self._drain_incoming()
+        self.requests_sent += 1
+        await self._to_bot(lambda: self.client.send_message(self._bot_entity, command))
 
         if not wait_response:
             return None
 
         # Wait for response
-        await asyncio.sleep(self.settings.delay_after_command)
-
         response = await self._get_last_bot_message(timeout)
         self._last_message = response
+        self._record(response)
 
         if response:
             logger.debug(
@@ -134,15 +338,17 @@ class BotTesterClient:
 
         logger.debug("Sending message", text=text[:50])
 
-        await self.client.send_message(self._bot_entity, text)
+        self._drain_incoming()
+        self.requests_sent += 1
+        self.state_changes += 1
+        await self._to_bot(lambda: self.client.send_message(self._bot_entity, text))
 
         if not wait_response:
             return None
 
-        await asyncio.sleep(self.settings.delay_after_command)
-
         response = await self._get_last_bot_message(timeout)
         self._last_message = response
+        self._record(response)
 
         return response
 
@@ -190,23 +396,26 @@ class BotTesterClient:
         )
 
         # Click the button
+        self._drain_incoming()
+        self.requests_sent += 1
         try:
-            await self.client(
-                GetBotCallbackAnswerRequest(
-                    peer=self._bot_entity,
-                    msg_id=message.id,
-                    data=button.data,
+            await self._to_bot(
+                lambda: self.client(
+                    GetBotCallbackAnswerRequest(
+                        peer=self._bot_entity,
+                        msg_id=message.id,
+                        data=button.data,
+                    )
                 )
             )
         except Exception as e:
             # Some buttons don't return a callback answer
             logger.debug("Button click callback", error=str(e))
 
-        await asyncio.sleep(self.settings.delay_after_command)
-
         # Get updated message or new message
         response = await self._get_last_bot_message(timeout)
         self._last_message = response
+        self._record(response)
 
         return response
 
@@ -241,8 +450,8 @@ class BotTesterClient:
         if col >= len(buttons):
             raise ValueError(f"Column {col} not found in row {row} (max: {len(buttons) - 1})")
 
-        button = buttons[col]
-        if not isinstance(button, KeyboardButtonCallback):
+        button = _flatten(message).positions.get((row, col))
+        if button is None:
             raise ValueError("Button is not a callback button")
 
         return await self.click_button(button_data=button.data, message=message, timeout=timeout)
@@ -255,49 +464,51 @@ class BotTesterClient:
         index: int | None = None,
     ) -> KeyboardButtonCallback | None:
         """Find a button in the message keyboard."""
-        if not isinstance(message.reply_markup, ReplyInlineMarkup):
-            return None
-
-        buttons: list[KeyboardButtonCallback] = []
-        for row in message.reply_markup.rows:
-            for button in row.buttons:
-                if isinstance(button, KeyboardButtonCallback):
-                    buttons.append(button)
+        flat = _flatten(message)
+        buttons = flat.buttons
 
         if index is not None and 0 <= index < len(buttons):
-            return buttons[index]
+            return buttons[index][2]
 
-        for button in buttons:
-            if text and button.text == text:
-                return button
-            if data and button.data == data:
-                return button
+        if text and text in flat.by_text:
+            return flat.by_text[text]
+        if data and data in flat.by_data:
+            return flat.by_data[data]
 
         # Partial text match
         if text:
-            for button in buttons:
-                if text.lower() in button.text.lower():
+            needle = text.lower()
+            for (_, _, button), lowered in zip(buttons, flat.lowered_texts):
+                if needle in lowered:
                     return button
 
         return None
 
+    async def _on_bot_message(self, event: events.NewMessage.Event) -> None:
+        """Queue a new or edited message from the bot."""
+        message = event.message
+        # Keep last_message current when the bot edits it in the background
+        last = self._last_message
+        if last is not None and message.id == last.id:
+            self._last_message = message
+            # Recorded too, so a replay applies the edit at the same point
+            self._record(message, edit=True)
+        self._incoming.put_nowait(message)
+
+    def _drain_incoming(self) -> None:
+        """Drop queued bot messages so stale ones aren't taken as replies."""
+        while not self._incoming.empty():
+            self._incoming.get_nowait()
+
     async def _get_last_bot_message(self, timeout: float) -> Message | None:
-        """Get the last message from the bot."""
+        """Wait for the next message (or edit) from the bot."""
         if self._bot_entity is None:
             return None
 
-        start_time = datetime.now()
-        while (datetime.now() - start_time).total_seconds() < timeout:
-            async for message in self.client.iter_messages(
-                self._bot_entity, limit=1
-            ):
-                if message.out:  # Skip our own messages
-                    continue
-                return message
-
-            await asyncio.sleep(0.5)
-
-        return None
+        try:
+            return await asyncio.wait_for(self._incoming.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
 
     def get_buttons(self, message: Message | None = None) -> list[dict[str, Any]]:
         """
@@ -310,21 +521,21 @@ class BotTesterClient:
             List of button info dicts.
         """
         message = message or self._last_message
-        if message is None or not isinstance(message.reply_markup, ReplyInlineMarkup):
+        if message is None:
             return []
 
-        buttons = []
-        for row_idx, row in enumerate(message.reply_markup.rows):
-            for col_idx, button in enumerate(row.buttons):
-                if isinstance(button, KeyboardButtonCallback):
-                    buttons.append({
-                        "text": button.text,
-                        "data": button.data.decode() if button.data else None,
-                        "row": row_idx,
-                        "col": col_idx,
-                    })
-
-        return buttons
+        flat = _flatten(message)
+        return [
+            {
+                "text": button.text,
+                "data": data,
+                "row": row_idx,
+                "col": col_idx,
+            }
+            for (row_idx, col_idx, button), data in zip(
+                flat.buttons, flat.decoded_data
+            )
+        ]
 
     def has_button(
         self,
@@ -343,16 +554,75 @@ class BotTesterClient:
         Returns:
             True if button exists.
         """
-        buttons = self.get_buttons(message)
+        message = message or self._last_message
+        if message is None:
+            return False
+
+        flat = _flatten(message)
+        needle = text.lower() if text else None
 
-        for button in buttons:
-            if text and text.lower() in button["text"].lower():
+        for lowered, data in zip(flat.lowered_texts, flat.decoded_data):
+            if needle and needle in lowered:
                 return True
-            if data_contains and button["data"] and data_contains in button["data"]:
+            if data_contains and data and data_contains in data:
                 return True
 
         return False
 
+    def begin_test(self, name: str) -> None:
+        """
+        Start recording the bot's replies for a test.
+
+        Args:
+            name: Test name.
+        """
+        self._recorded = []
+
+    def end_test(self) -> list[dict[str, Any] | None]:
+        """
+        Stop recording the bot's replies for a test.
+
+        Returns:
+            Replies as text and buttons dicts, None where none came.
+        """
+        recorded, self._recorded = self._recorded, []
+        return recorded
+
+    def _record(self, response: Message | None, edit: bool = False) -> None:
+        """
+        Record a reply (or its absence) for the running test.
+
+        Args:
+            response: Reply, or None if none came.
+            edit: The reply is a background edit of the last message rather
+                than the answer to a request.
+        """
+        if response is None:
+            self._recorded.append(None)
+            return
+        entry = {"text": response.text or "", "buttons": self.get_buttons(response)}
+        if edit:
+            entry["edit"] = True
+        self._recorded.append(entry)
+
+    @property
+    def chat_key(self) -> str:
+        """Get a key identifying the chat between this session and the bot."""
+        return f"{self.settings.session_name}:{self.settings.target_bot_username}"
+
+    def reuse_response(self, message: Message) -> None:
+        """
+        Make an earlier bot reply the last message again, without sending.
+
+        The reply is recorded for the running test like a received one, so
+        a replay hands it back at the same point.
+
+        Args:
+            message: Earlier reply from the bot.
+        """
+        self._last_message = message
+        self._record(message)
+
     @property
     def last_message(self) -> Message | None:
         """Get the last received message."""
@@ -364,3 +634,12 @@ class BotTesterClient:
         if self._last_message:
             return self._last_message.text or ""
         return ""
+
+    @property
+    def last_text_lower(self) -> str:
+        """Get lowercased text of last message, computed once per message."""
+        message, text = self._lower_text
+        if message is not self._last_message:
+            text = self.last_text.lower()
+            self._lower_text = (self._last_message, text)
+        return text
@@ -2,6 +2,8 @@
 Configuration management for the bot tester.
 """
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -19,6 +21,11 @@ class Settings(BaseSettings):
 
     # Session settings
     session_name: str = Field(default="tester", description="Session file name")
+    extra_phones: list[str] = Field(
+        default_factory=list,
+        description="Phone numbers of other accounts for the extra --parallel "
+        "sessions '<session_name>_1', '<session_name>_2', ...",
+    )
 
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
@@ -39,6 +46,7 @@ class Settings(BaseSettings):
     }
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings (loaded once per process)."""
     return Settings()
@@ -3,26 +3,32 @@ Interactive testing mode for manual bot exploration.
 """
 
 import asyncio
+from typing import Awaitable, Callable
 
 from rich.console import Console
-from rich.prompt import Prompt
 from rich.table import Table
 from rich import box
 
 from .client import BotTesterClient
 from .config import get_settings
 from .utils.logging import setup_logging, get_logger
+from .utils.runtime import enable_eager_tasks, read_stdin_line, run
 
 logger = get_logger(__name__)
 
+# Shared console: creating one probes the terminal each time
+_console = Console()
+
 
 class InteractiveSession:
     """Interactive testing session."""
 
+    __slots__ = ("client", "console", "running")
+
     def __init__(self, client: BotTesterClient) -> None:
         """Initialize interactive session."""
         self.client = client
-        self.console = Console()
+        self.console = _console
         self.running = True
 
     async def run(self) -> None:
@@ -32,52 +38,26 @@ class InteractiveSession:
 
         while self.running:
             try:
-                user_input = Prompt.ask("[cyan]>[/cyan]")
+                self.console.print("[cyan]>[/cyan]: ", end="")
+                user_input = await read_stdin_line()
                 await self.handle_input(user_input)
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
+                # Ctrl+C cancels the main task rather than raising here
                 break
             except Exception as e:
                 self.console.print(f"[red]Error: {str(e)}[/red]")
 
     async def handle_input(self, user_input: str) -> None:
         """Handle user input."""
+        user_input = user_input.strip()
         if not user_input:
             return
 
-        parts = user_input.strip().split(maxsplit=1)
-        cmd = parts[0].lower()
-        arg = parts[1] if len(parts) > 1 else ""
-
-        if cmd == "/quit" or cmd == "/q":
-            self.running = False
-            self.console.print("[yellow]Goodbye![/yellow]")
-
-        elif cmd == "/help" or cmd == "/h":
-            self.show_help()
-
-        elif cmd == "/cmd" or cmd == "/c":
-            if not arg:
-                self.console.print("[yellow]Usage: /cmd <command>[/yellow]")
-                return
-            await self.send_command(arg if arg.startswith("/") else f"/{arg}")
+        cmd, _, arg = user_input.partition(" ")
+        handler = self._COMMANDS.get(cmd.lower())
 
-        elif cmd == "/click" or cmd == "/k":
-            if not arg:
-                self.console.print("[yellow]Usage: /click <button_text>[/yellow]")
-                return
-            await self.click_button(arg)
-
-        elif cmd == "/buttons" or cmd == "/b":
-            self.show_buttons()
-
-        elif cmd == "/text" or cmd == "/t":
-            self.show_text()
-
-        elif cmd == "/msg" or cmd == "/m":
-            if not arg:
-                self.console.print("[yellow]Usage: /msg <text>[/yellow]")
-                return
-            await self.send_message(arg)
+        if handler is not None:
+            await handler(self, arg.lstrip())
 
         elif cmd.startswith("/"):
             # Treat as bot command
@@ -87,6 +67,62 @@ class InteractiveSession:
             # Treat as message
             await self.send_message(user_input)
 
+    async def _quit(self, arg: str) -> None:
+        """Handle /quit."""
+        self.running = False
+        self.console.print("[yellow]Goodbye![/yellow]")
+
+    async def _help(self, arg: str) -> None:
+        """Handle /help."""
+        self.show_help()
+
+    async def _cmd(self, arg: str) -> None:
+        """Handle /cmd <command>."""
+        if not arg:
+            self.console.print("[yellow]Usage: /cmd <command>[/yellow]")
+            return
+        await self.send_command(arg if arg.startswith("/") else f"/{arg}")
+
+    async def _click(self, arg: str) -> None:
+        """Handle /click <button_text>."""
+        if not arg:
+            self.console.print("[yellow]Usage: /click <button_text>[/yellow]")
+            return
+        await self.click_button(arg)
+
+    async def _buttons(self, arg: str) -> None:
+        """Handle /buttons."""
+        self.show_buttons()
+
+    async def _text(self, arg: str) -> None:
+        """Handle /text."""
+        self.show_text()
+
+    async def _msg(self, arg: str) -> None:
+        """Handle /msg <text>."""
+        if not arg:
+            self.console.print("[yellow]Usage: /msg <text>[/yellow]")
+            return
+        await self.send_message(arg)
+
+    # Session commands and their short aliases
+    _COMMANDS: dict[str, Callable[["InteractiveSession", str], Awaitable[None]]] = {
+        "/quit": _quit,
+        "/q": _quit,
+        "/help": _help,
+        "/h": _help,
+        "/cmd": _cmd,
+        "/c": _cmd,
+        "/click": _click,
+        "/k": _click,
+        "/buttons": _buttons,
+        "/b": _buttons,
+        "/text": _text,
+        "/t": _text,
+        "/msg": _msg,
+        "/m": _msg,
+    }
+
     def show_help(self) -> None:
         """Show help."""
         table = Table(title="Commands", box=box.ROUNDED)
@@ -164,9 +200,10 @@ class InteractiveSession:
 
 async def main_async() -> None:
     """Async main function."""
+    enable_eager_tasks()
     setup_logging("INFO")
     settings = get_settings()
-    console = Console()
+    console = _console
 
     console.print(f"\n[bold cyan]🎮 a_bot Interactive Tester[/bold cyan]")
     console.print(f"Target bot: @{settings.target_bot_username}")
@@ -183,7 +220,7 @@ async def main_async() -> None:
 
 def main() -> None:
     """Main entry point."""
-    asyncio.run(main_async())
+    run(main_async())
 
 
 if __name__ == "__main__":
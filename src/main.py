@@ -3,18 +3,33 @@ Main entry point for the bot tester.
 """
 
 import argparse
-import asyncio
 import sys
-
-from rich.console import Console
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .client import BotTesterClient
 from .config import get_settings
-from .tester import BotTester, TestSuite, run_quick_test
 from .utils.logging import setup_logging, get_logger
+from .utils.runtime import enable_eager_tasks, run
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 logger = get_logger(__name__)
 
+# Shared console, created on first use: creating one probes the terminal
+_console: "Console | None" = None
+
+
+def _get_console() -> "Console":
+    """Get the shared console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
 
 async def main_async(args: argparse.Namespace) -> int:
     """
@@ -26,31 +41,59 @@ async def main_async(args: argparse.Namespace) -> int:
     Returns:
         Exit code.
     """
-    console = Console()
+    enable_eager_tasks()
+    console = _get_console()
     settings = get_settings()
 
-    # Override bot username if provided
+    # Override bot username if provided (on a copy: settings are cached)
     if args.bot_username:
-        settings.target_bot_username = args.bot_username
+        settings = settings.model_copy(
+            update={"target_bot_username": args.bot_username}
+        )
 
     console.print(f"\n[bold cyan]🤖 a_bot Tester[/bold cyan]")
     console.print(f"Target bot: @{settings.target_bot_username}")
     console.print()
 
-    client = BotTesterClient(settings)
+    if args.rejudge:
+        # Re-run the assertions on the replies recorded in an earlier report
+        from .replay import ReplayClient
+        from .utils.report import TestReport
+
+        recorded = TestReport.load(Path(args.rejudge))
+        if recorded.bot != settings.target_bot_username:
+            console.print(
+                f"[bold red]❌ {args.rejudge} was recorded against "
+                f"@{recorded.bot}, not @{settings.target_bot_username}[/bold red]"
+            )
+            return 1
+        client = ReplayClient(settings, recorded)
+    else:
+        client = BotTesterClient(settings)
 
     try:
         await client.start()
 
+        # The suites are only imported when they are going to run
         if args.quick:
+            from .tester import run_quick_test
+
             success = await run_quick_test(client)
             return 0 if success else 1
 
         # Run full tests
+        from .tester import BotTester, TestSuite
+
         tester = BotTester(client)
 
         suite = TestSuite(args.test) if args.test else TestSuite.ALL
-        report = await tester.run(suite=suite, verbose=not args.quiet)
+        report = await tester.run(
+            suite=suite,
+            verbose=not args.quiet,
+            parallel=args.parallel and not args.rejudge,
+        )
+        if args.save_report:
+            report.save(Path(args.save_report))
 
         # Exit code based on results
         if report.failed > 0 or report.errors > 0:
@@ -89,6 +132,23 @@ def main() -> None:
         action="store_true",
         help="Run quick sanity test only",
     )
+    parser.add_argument(
+        "--parallel",
+        "-p",
+        action="store_true",
+        help="Run suites concurrently on separate accounts: needs EXTRA_PHONES "
+        "(JSON list) and sessions logged in with 'python -m src.auth --extra N'",
+    )
+    parser.add_argument(
+        "--save-report",
+        metavar="PATH",
+        help="Save the report, with the bot's replies, as JSON",
+    )
+    parser.add_argument(
+        "--rejudge",
+        metavar="PATH",
+        help="Re-run the tests on the replies saved in a report, without the bot",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -106,7 +166,7 @@ def main() -> None:
 
     setup_logging(args.log_level)
 
-    exit_code = asyncio.run(main_async(args))
+    exit_code = run(main_async(args))
     sys.exit(exit_code)
 
 
@@ -0,0 +1,240 @@
+"""
+Client replaying bot replies recorded in a saved test report.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from .config import Settings
+from .utils.logging import get_logger
+from .utils.report import TestReport
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True, eq=False)
+class RecordedMessage:
+    """Bot reply as recorded in a report."""
+
+    text: str
+    buttons: list[dict[str, Any]] = field(default_factory=list)
+
+
+class ReplayClient:
+    """
+    Stand-in for BotTesterClient that answers from a saved report.
+
+    Each test gets the replies recorded for it, in order, so the test
+    suites can be re-judged against the bot's earlier behaviour without
+    sending anything to Telegram. Background edits of the last message are
+    applied when the test pauses (BaseTest.delay) or makes its next request.
+    """
+
+    replaying = True
+
+    def __init__(self, settings: Settings, report: TestReport) -> None:
+        """
+        Initialize the replay client.
+
+        Args:
+            settings: Application settings.
+            report: Saved report with the replies to replay.
+        """
+        self.settings = settings
+        self._replies = report.responses_by_test()
+        self._pending: list[dict[str, Any] | None] = []
+        self._recorded: list[dict[str, Any] | None] = []
+        self._last_message: RecordedMessage | None = None
+        self.requests_sent = 0
+        self.state_changes = 0
+
+    async def start(self) -> None:
+        """Nothing to connect to."""
+
+    async def stop(self) -> None:
+        """Nothing to disconnect from."""
+
+    def begin_test(self, name: str) -> None:
+        """
+        Queue the replies recorded for a test.
+
+        Args:
+            name: Test name.
+        """
+        self._pending = list(reversed(self._replies.get(name, [])))
+        self._recorded = []
+        if name not in self._replies:
+            logger.warning("No recorded replies", test_name=name)
+
+    def end_test(self) -> list[dict[str, Any] | None]:
+        """
+        Finish a test.
+
+        Returns:
+            Replies the test consumed.
+        """
+        recorded, self._recorded = self._recorded, []
+        return recorded
+
+    def _next_reply(self) -> RecordedMessage | None:
+        """Take the next recorded reply; None once they run out."""
+        self.requests_sent += 1
+        self.apply_edits()
+        reply = self._pending.pop() if self._pending else None
+        self._recorded.append(reply)
+        self._last_message = (
+            RecordedMessage(reply["text"], reply["buttons"])
+            if reply is not None
+            else None
+        )
+        return self._last_message
+
+    def apply_edits(self) -> None:
+        """Apply the background edits of the last message recorded next."""
+        while self._pending and (self._pending[-1] or {}).get("edit"):
+            edit = self._pending.pop()
+            self._recorded.append(edit)
+            if self._last_message is not None:
+                self._last_message = RecordedMessage(edit["text"], edit["buttons"])
+
+    async def send_command(
+        self,
+        command: str,
+        wait_response: bool = True,
+        timeout: float | None = None,
+    ) -> RecordedMessage | None:
+        """Replay the reply to a command."""
+        if not wait_response:
+            self.requests_sent += 1
+            return None
+        return self._next_reply()
+
+    async def send_message(
+        self,
+        text: str,
+        wait_response: bool = True,
+        timeout: float | None = None,
+    ) -> RecordedMessage | None:
+        """Replay the reply to a text message."""
+        self.state_changes += 1
+        if not wait_response:
+            self.requests_sent += 1
+            return None
+        return self._next_reply()
+
+    async def click_button(
+        self,
+        button_text: str | None = None,
+        button_data: bytes | None = None,
+        button_index: int | None = None,
+        message: RecordedMessage | None = None,
+        timeout: float | None = None,
+    ) -> RecordedMessage | None:
+        """Replay the reply to a button click; the button must exist."""
+        message = message or self._last_message
+        if message is None:
+            raise ValueError("No message provided and no last message available")
+
+        if self._find_button(message, button_text, button_data, button_index) is None:
+            raise ValueError(
+                f"Button not found: text={button_text}, data={button_data}, "
+                f"index={button_index}"
+            )
+        return self._next_reply()
+
+    async def click_button_by_position(
+        self,
+        row: int,
+        col: int,
+        message: RecordedMessage | None = None,
+        timeout: float | None = None,
+    ) -> RecordedMessage | None:
+        """Replay the reply to clicking the button at a position."""
+        message = message or self._last_message
+        if message is None or not message.buttons:
+            raise ValueError("No inline keyboard found")
+
+        for button in message.buttons:
+            if button["row"] == row and button["col"] == col:
+                return self._next_reply()
+        raise ValueError(f"Button at row {row}, column {col} not found")
+
+    def _find_button(
+        self,
+        message: RecordedMessage,
+        text: str | None = None,
+        data: bytes | None = None,
+        index: int | None = None,
+    ) -> dict[str, Any] | None:
+        """Find a button like BotTesterClient._find_button."""
+        buttons = message.buttons
+
+        if index is not None and 0 <= index < len(buttons):
+            return buttons[index]
+
+        decoded = data.decode() if data else None
+        for button in buttons:
+            if text and button["text"] == text:
+                return button
+        for button in buttons:
+            if decoded and button["data"] == decoded:
+                return button
+
+        if text:
+            needle = text.lower()
+            for button in buttons:
+                if needle in button["text"].lower():
+                    return button
+
+        return None
+
+    def get_buttons(
+        self,
+        message: RecordedMessage | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get the buttons of a recorded reply."""
+        message = message or self._last_message
+        if message is None:
+            return []
+        return message.buttons
+
+    def has_button(
+        self,
+        text: str | None = None,
+        data_contains: str | None = None,
+        message: RecordedMessage | None = None,
+    ) -> bool:
+        """Check if a recorded reply has a button, like BotTesterClient."""
+        needle = text.lower() if text else None
+        for button in self.get_buttons(message):
+            if needle and needle in button["text"].lower():
+                return True
+            if data_contains and button["data"] and data_contains in button["data"]:
+                return True
+        return False
+
+    @property
+    def chat_key(self) -> str:
+        """Get a key identifying the replayed chat."""
+        return f"replay:{self.settings.target_bot_username}"
+
+    def reuse_response(self, message: RecordedMessage) -> None:
+        """Make an earlier reply the last message again."""
+        self._last_message = message
+
+    @property
+    def last_message(self) -> RecordedMessage | None:
+        """Get the last replayed message."""
+        return self._last_message
+
+    @property
+    def last_text(self) -> str:
+        """Get text of last message."""
+        if self._last_message:
+            return self._last_message.text
+        return ""
+
+    @property
+    def last_text_lower(self) -> str:
+        """Get lowercased text of last message."""
+        return self.last_text.lower()
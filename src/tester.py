@@ -3,13 +3,17 @@ Test orchestrator for running all bot tests.
 """
 
 import asyncio
+import logging
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from enum import Enum
 from typing import TYPE_CHECKING
 
 from rich.console import Console
 
-from .tests import CommandTests, CallbackTests, FlowTests
-from .utils.report import TestReport
+from .tests import BaseTest, CommandTests, CallbackTests, FlowTests
+from .utils.cache import clear_responses
+from .utils.report import TestReport, TestResult
 from .utils.logging import get_logger
 
 if TYPE_CHECKING:
@@ -17,6 +21,12 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Shared console: creating one probes the terminal each time
+_console = Console()
+
+# Sessions a single suite's tests are spread over with parallel=True
+PARALLEL_SESSIONS = 3
+
 
 class TestSuite(str, Enum):
     """Available test suites."""
@@ -32,6 +42,8 @@ class BotTester:
     Test orchestrator for running bot tests.
     """
 
+    __slots__ = ("client", "console")
+
     def __init__(self, client: "BotTesterClient") -> None:
         """
         Initialize the tester.
@@ -40,12 +52,13 @@ class BotTester:
             client: Bot tester client.
         """
         self.client = client
-        self.console = Console()
+        self.console = _console
 
     async def run(
         self,
         suite: TestSuite = TestSuite.ALL,
         verbose: bool = True,
+        parallel: bool = False,
     ) -> TestReport:
         """
         Run tests.
@@ -53,44 +66,31 @@ class BotTester:
         Args:
             suite: Test suite to run.
             verbose: Print detailed output.
+            parallel: Run suites concurrently, each on its own account; a
+                single suite spreads its tests over PARALLEL_SESSIONS accounts.
+                The extra accounts come from settings.extra_phones.
 
         Returns:
             Test report.
         """
-        report = TestReport()
+        report = TestReport(bot=self.client.settings.target_bot_username)
+        clear_responses()
 
         self.console.print("\n[bold cyan]🤖 Starting a_bot Test Suite[/bold cyan]\n")
 
-        suites_to_run = []
+        suites_to_run: list[tuple[str, type[BaseTest]]] = []
 
         if suite in (TestSuite.ALL, TestSuite.COMMANDS):
-            suites_to_run.append(("Commands", CommandTests(self.client)))
+            suites_to_run.append(("Commands", CommandTests))
 
         if suite in (TestSuite.ALL, TestSuite.CALLBACKS):
-            suites_to_run.append(("Callbacks", CallbackTests(self.client)))
+            suites_to_run.append(("Callbacks", CallbackTests))
 
         if suite in (TestSuite.ALL, TestSuite.FLOWS):
-            suites_to_run.append(("Flows", FlowTests(self.client)))
+            suites_to_run.append(("Flows", FlowTests))
 
-        for suite_name, test_suite in suites_to_run:
-            self.console.print(f"\n[bold yellow]📋 Running {suite_name} Tests[/bold yellow]")
-
-            try:
-                results = await test_suite.run_all()
-                for result in results:
-                    report.add_result(result)
-
-                    # Print individual result
-                    if result.passed:
-                        self.console.print(f"  ✅ {result.name} ({result.duration_ms:.0f}ms)")
-                    else:
-                        self.console.print(
-                            f"  ❌ {result.name}: {result.message} ({result.duration_ms:.0f}ms)"
-                        )
-
-            except Exception as e:
-                logger.error("Suite error", suite=suite_name, error=str(e))
-                self.console.print(f"  💥 Suite error: {str(e)}")
+        with self._progress(report):
+            await self._run_suites(suites_to_run, report, parallel)
 
         report.finish()
 
@@ -100,6 +100,196 @@ class BotTester:
 
         return report
 
+    async def _run_suites(
+        self,
+        suites_to_run: list[tuple[str, type[BaseTest]]],
+        report: TestReport,
+        parallel: bool,
+    ) -> None:
+        """
+        Run suites, adding their results to the report.
+
+        Args:
+            suites_to_run: Suite names and classes.
+            report: Report to add results to.
+            parallel: Run concurrently (see run).
+        """
+        if parallel and len(suites_to_run) > 1:
+            await self._run_parallel(suites_to_run, report)
+        elif parallel:
+            suite_name, suite_class = suites_to_run[0]
+            self.console.print(
+                f"\n[bold yellow]📋 Running {suite_name} Tests in parallel"
+                "[/bold yellow]"
+            )
+
+            try:
+                async with self._extra_clients(PARALLEL_SESSIONS - 1) as extra:
+                    results = await suite_class(
+                        self.client, extra, report.add_result
+                    ).run_all()
+            except Exception as e:
+                self._print_suite_error(suite_name, e)
+            else:
+                self._print_results(results)
+        else:
+            for suite_name, suite_class in suites_to_run:
+                self.console.print(
+                    f"\n[bold yellow]📋 Running {suite_name} Tests[/bold yellow]"
+                )
+
+                try:
+                    results = await suite_class(
+                        self.client, on_result=report.add_result
+                    ).run_all()
+                except Exception as e:
+                    self._print_suite_error(suite_name, e)
+                else:
+                    self._print_results(results)
+
+    @contextmanager
+    def _progress(self, report: TestReport) -> Iterator[None]:
+        """
+        Show the live result summary while suites run, on a terminal.
+
+        Log lines go to stderr on their own and would tear up the live
+        display, so info logs are held back while it is shown. With debug
+        logging on, the logs win and there is no live display.
+
+        Args:
+            report: Report being filled.
+        """
+        root = logging.getLogger()
+        if not self.console.is_terminal or root.isEnabledFor(logging.DEBUG):
+            yield
+            return
+
+        level = root.level
+        root.setLevel(max(level, logging.WARNING))
+        try:
+            with report.live(self.console):
+                yield
+        finally:
+            root.setLevel(level)
+
+    async def _run_parallel(
+        self,
+        suites_to_run: list[tuple[str, type[BaseTest]]],
+        report: TestReport,
+    ) -> None:
+        """
+        Run suites concurrently, giving each one its own account.
+
+        Suites keep per-client state (last message, pending replies), and
+        the bot keeps per-user state, so they can't share an account. The
+        first suite uses this tester's client; the others use the extra
+        accounts (see _extra_clients).
+
+        Args:
+            suites_to_run: Suite names and classes.
+            report: Report to add results to.
+        """
+        names = ", ".join(name for name, _ in suites_to_run)
+        self.console.print(
+            f"\n[bold yellow]📋 Running {names} Tests in parallel[/bold yellow]"
+        )
+
+        async with self._extra_clients(len(suites_to_run) - 1) as extra:
+            clients = [self.client, *extra]
+            outcomes = await asyncio.gather(
+                *(
+                    suite_class(client, on_result=report.add_result).run_all()
+                    for (_, suite_class), client in zip(suites_to_run, clients)
+                ),
+                return_exceptions=True,
+            )
+
+        for (suite_name, _), outcome in zip(suites_to_run, outcomes):
+            self.console.print(f"\n[bold yellow]📋 {suite_name} Tests[/bold yellow]")
+            if isinstance(outcome, BaseException):
+                self._print_suite_error(suite_name, outcome)
+            else:
+                self._print_results(outcome)
+
+    @asynccontextmanager
+    async def _extra_clients(
+        self,
+        count: int,
+    ) -> AsyncIterator[list["BotTesterClient"]]:
+        """
+        Start clients on sessions '<session_name>_1' .. '<session_name>_<count>'.
+
+        Session n is for the account with phone settings.extra_phones[n - 1].
+        Each account has its own chat with the bot, so tests on different
+        clients can't see each other's replies. The sessions must already
+        be logged in (they can't prompt for a code while tests run). The
+        clients are stopped on exit.
+
+        Args:
+            count: Number of clients to start.
+
+        Yields:
+            Started clients.
+
+        Raises:
+            ValueError: If there are too few extra phones, or two sessions
+                are logged in to the same account.
+            RuntimeError: If a session isn't logged in.
+        """
+        from .client import BotTesterClient
+
+        settings = self.client.settings
+        if len(settings.extra_phones) < count:
+            raise ValueError(
+                f"Running in parallel needs {count} extra account(s) in "
+                f"EXTRA_PHONES, got {len(settings.extra_phones)}"
+            )
+        clients = [
+            BotTesterClient(
+                settings.model_copy(
+                    update={
+                        "session_name": f"{settings.session_name}_{i}",
+                        "telegram_phone": phone,
+                    }
+                )
+            )
+            for i, phone in enumerate(settings.extra_phones[:count], start=1)
+        ]
+
+        try:
+            await asyncio.gather(*(client.start(login=False) for client in clients))
+            account_ids = await asyncio.gather(
+                *(client.account_id() for client in (self.client, *clients))
+            )
+            if len(set(account_ids)) < len(account_ids):
+                raise ValueError(
+                    "Parallel sessions must be logged in to different accounts"
+                )
+            yield clients
+        finally:
+            await asyncio.gather(*(client.stop() for client in clients))
+
+    def _print_results(self, results: list[TestResult]) -> None:
+        """Print a suite's results (already in the report), one per line."""
+        lines = []
+        for result in results:
+            # Individual result line
+            if result.passed:
+                lines.append(f"  ✅ {result.name} ({result.duration_ms:.0f}ms)")
+            else:
+                lines.append(
+                    f"  ❌ {result.name}: {result.message} ({result.duration_ms:.0f}ms)"
+                )
+
+        # One render and write for the whole suite
+        if lines:
+            self.console.print("\n".join(lines))
+
+    def _print_suite_error(self, suite_name: str, error: BaseException) -> None:
+        """Log and print an error that aborted a suite."""
+        logger.error("Suite error", suite=suite_name, error=str(error))
+        self.console.print(f"  💥 Suite error: {str(error)}")
+
 
 async def run_quick_test(client: "BotTesterClient") -> bool:
     """
@@ -111,7 +301,7 @@ async def run_quick_test(client: "BotTesterClient") -> bool:
     Returns:
         True if basic functionality works.
     """
-    console = Console()
+    console = _console
     console.print("\n[bold cyan]🔧 Running Quick Test[/bold cyan]\n")
 
     try:
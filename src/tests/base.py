@@ -3,10 +3,19 @@ Base test class for bot testing.
 """
 
 import asyncio
-import time
+import random
+import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections.abc import Iterable
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable
 
+try:
+    import ahocorasick
+except ImportError:  # optional: falls back to a regex alternation
+    ahocorasick = None
+
+from ..utils.cache import get_response, store_response
 from ..utils.report import TestResult, TestStatus
 from ..utils.logging import get_logger
 
@@ -16,18 +25,69 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def keywords(*words: str) -> Callable[[str], bool]:
+    """
+    Build a check for whether a text contains any of the given keywords.
+
+    Uses an Aho-Corasick automaton (one pass over the text) when
+    pyahocorasick is installed, else a compiled regex alternation.
+
+    Args:
+        *words: Lowercase keywords.
+
+    Returns:
+        Function telling whether a (lowercased) text contains a keyword.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+
+    pattern = re.compile("|".join(map(re.escape, words)))
+    return lambda text: pattern.search(text) is not None
+
+
 class BaseTest(ABC):
     """Base class for test suites."""
 
-    def __init__(self, client: "BotTesterClient") -> None:
+    __slots__ = (
+        "client",
+        "extra_clients",
+        "on_result",
+        "results",
+        "_buttons_snapshot",
+        "_button_lookups",
+    )
+
+    def __init__(
+        self,
+        client: "BotTesterClient",
+        extra_clients: list["BotTesterClient"] | None = None,
+        on_result: Callable[[TestResult], None] | None = None,
+    ) -> None:
         """
         Initialize the test suite.
 
         Args:
             client: Bot tester client.
+            extra_clients: Additional started clients, each logged in to
+                another account; when given, run_tests spreads tests over all
+                clients concurrently.
+            on_result: Called with each test result as soon as it is ready,
+                e.g. to update a live display.
         """
         self.client = client
+        self.extra_clients = extra_clients or []
+        self.on_result = on_result
         self.results: list[TestResult] = []
+        # Buttons of the last message and button searches made on them;
+        # both are reset when the message changes
+        self._buttons_snapshot: tuple[Any, list[dict[str, Any]]] = (None, [])
+        self._button_lookups: dict[
+            tuple[str | None, str | None], dict[str, Any] | None
+        ] = {}
 
     @abstractmethod
     async def run_all(self) -> list[TestResult]:
@@ -58,27 +118,28 @@ class BaseTest(ABC):
         Returns:
             Test result.
         """
-        start_time = time.time()
+        start_time = perf_counter()
+        sent_before = self.client.requests_sent
         logger.info("Running test", test_name=name)
+        self.client.begin_test(name)
 
         try:
-            result = await test_func(*args, **kwargs)
-            duration_ms = (time.time() - start_time) * 1000
+            outcome = await test_func(*args, **kwargs)
+            duration_ms = (perf_counter() - start_time) * 1000
 
-            if isinstance(result, TestResult):
+            if isinstance(outcome, TestResult):
+                result = outcome
                 result.duration_ms = duration_ms
-                return result
-
             # Test function returned True/False
-            if result:
-                return TestResult(
+            elif outcome:
+                result = TestResult(
                     name=name,
                     status=TestStatus.PASSED,
                     duration_ms=duration_ms,
                     message="Test passed",
                 )
             else:
-                return TestResult(
+                result = TestResult(
                     name=name,
                     status=TestStatus.FAILED,
                     duration_ms=duration_ms,
@@ -86,15 +147,156 @@ class BaseTest(ABC):
                 )
 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (perf_counter() - start_time) * 1000
             logger.error("Test error", test_name=name, error=str(e))
-            return TestResult(
+            result = TestResult(
                 name=name,
                 status=TestStatus.ERROR,
                 duration_ms=duration_ms,
                 message=str(e),
             )
 
+        result.test_id = name
+        result.outgoing = self.client.requests_sent > sent_before
+        result.raw_responses = self.client.end_test()
+        if self.on_result is not None:
+            self.on_result(result)
+        return result
+
+    async def run_tests(
+        self,
+        tests: Iterable[tuple[str, str]],
+    ) -> list[TestResult]:
+        """
+        Run independent tests, in parallel if extra clients are available.
+
+        Without extra clients, tests run one by one, pausing after each test
+        that sent something to the bot.
+        Otherwise each test runs on whichever client is free (so at most one
+        test per session at a time), on a copy of this suite bound to that
+        client. Tests must therefore not rely on state left by earlier ones.
+
+        Args:
+            tests: Test names and the names of this suite's test methods.
+
+        Returns:
+            Test results, in the order of tests.
+        """
+        if not self.extra_clients:
+            results = []
+            for name, method in tests:
+                result = await self.run_test(name, getattr(self, method))
+                results.append(result)
+                await self.pause_after(result)
+            return results
+
+        pool: asyncio.Queue["BotTesterClient"] = asyncio.Queue()
+        for client in (self.client, *self.extra_clients):
+            pool.put_nowait(client)
+
+        return list(await asyncio.gather(
+            *(self._run_pooled(pool, name, method) for name, method in tests)
+        ))
+
+    async def _run_pooled(
+        self,
+        pool: "asyncio.Queue[BotTesterClient]",
+        name: str,
+        method: str,
+    ) -> TestResult:
+        """Run one test on a client leased from the pool."""
+        client = await pool.get()
+        try:
+            suite = type(self)(client, on_result=self.on_result)
+            result = await suite.run_test(name, getattr(suite, method))
+            # Jittered pause so sessions don't hit the bot in lockstep
+            if result.outgoing:
+                delay = client.settings.delay_between_tests
+                await asyncio.sleep(random.uniform(0.5, 1.0) * delay)
+            return result
+        finally:
+            pool.put_nowait(client)
+
+    async def send_command_memo(self, command: str, fresh: bool = False) -> Any:
+        """
+        Send a command, reusing the bot's reply if it was already seen.
+
+        A reply is reused if the command was sent earlier in the run from
+        the same session, with no free-text message sent since. Only use
+        it where the test just needs a reply, not the bot's reaction now.
+        When replaying, the command is always "sent": the recording has a
+        reply for every call, reused or not.
+
+        Args:
+            command: Command to send (e.g., "/start").
+            fresh: Always send the command, but cache the reply.
+
+        Returns:
+            Bot's reply message or None.
+        """
+        client = self.client
+        if not fresh and not client.replaying:
+            cached = get_response(command, client.chat_key, client.state_changes)
+            if cached is not None:
+                logger.debug("Reusing cached response", command=command)
+                client.reuse_response(cached.message)
+                return cached.message
+
+        response = await client.send_command(command)
+        if response is not None:
+            store_response(command, client.chat_key, client.state_changes, response)
+        return response
+
+    def cached_buttons(self) -> list[dict[str, Any]]:
+        """
+        Get the buttons of the client's last message.
+
+        The list is reused until the client's last message changes.
+
+        Returns:
+            List of button info dicts (see BotTesterClient.get_buttons).
+        """
+        message = self.client.last_message
+        cached_for, buttons = self._buttons_snapshot
+        if message is not cached_for:
+            buttons = self.client.get_buttons(message) if message is not None else []
+            self._buttons_snapshot = (message, buttons)
+            self._button_lookups = {}
+        return buttons
+
+    def find_button(
+        self,
+        text: str | None = None,
+        data_contains: str | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Find a button on the last message, matching like has_button.
+
+        Args:
+            text: Substring of the button text (case-insensitive).
+            data_contains: Substring of the button data.
+
+        Returns:
+            First matching button info dict, or None.
+        """
+        buttons = self.cached_buttons()
+        key = (text, data_contains)
+        if key in self._button_lookups:
+            return self._button_lookups[key]
+
+        found = None
+        needle = text.lower() if text else None
+        for button in buttons:
+            if needle and needle in button["text"].lower():
+                found = button
+                break
+            if data_contains and button["data"] and data_contains in button["data"]:
+                found = button
+                break
+
+        self._button_lookups[key] = found
+        return found
+
     def assert_text_contains(
         self,
         text: str,
@@ -141,8 +343,8 @@ class BaseTest(ABC):
         Raises:
             AssertionError: If assertion fails.
         """
-        if not self.client.has_button(text=text, data_contains=data_contains):
-            buttons = self.client.get_buttons()
+        if self.find_button(text=text, data_contains=data_contains) is None:
+            buttons = self.cached_buttons()
             raise AssertionError(
                 message or f"Expected button with text='{text}' or data containing '{data_contains}'. "
                 f"Available buttons: {buttons}"
@@ -166,6 +368,22 @@ class BaseTest(ABC):
             raise AssertionError(message or "No response received from bot")
         return True
 
+    async def pause_after(self, result: TestResult) -> None:
+        """
+        Pause between tests, but only after one that talked to the bot.
+
+        Tests that sent nothing (they only inspected client state) just
+        yield to the event loop. Skipped tests may have sent commands before
+        bailing out, so they are paused after like any other.
+
+        Args:
+            result: Result of the test that just ran.
+        """
+        if result.outgoing:
+            await self.delay()
+        else:
+            await asyncio.sleep(0)
+
     async def delay(self, seconds: float | None = None) -> None:
         """
         Delay between tests.
@@ -173,5 +391,10 @@ class BaseTest(ABC):
         Args:
             seconds: Delay in seconds.
         """
+        if self.client.replaying:
+            # Recorded replies don't need pacing, but edits the bot made
+            # during the pause are due now
+            self.client.apply_edits()
+            return
         seconds = seconds or self.client.settings.delay_between_tests
         await asyncio.sleep(seconds)
@@ -2,34 +2,84 @@
 Callback/button tests for a_bot.
 """
 
-from .base import BaseTest
+from typing import TYPE_CHECKING, Any, Callable
+
+from .base import BaseTest, keywords
 from ..utils.report import TestResult, TestStatus
 from ..utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from ..client import BotTesterClient
+
 logger = get_logger(__name__)
 
 
+# Buttons expected in the main menu (lowercase substrings)
+_MAIN_MENU_KEYWORDS = ("spread", "alert", "setting")
+
+# Markers of each view in the lowercased message text
+_SPREADS_VIEW = keywords("spread", "funding", "📊", "no", "loading", "fetching")
+_ALERTS_VIEW = keywords("alert", "🔔", "no alerts", "your alerts")
+_SETTINGS_VIEW = keywords("setting", "language", "timezone", "⚙️")
+_REFRESHED_SPREADS_VIEW = keywords("spread", "funding", "📊", "no")
+
+
 class CallbackTests(BaseTest):
     """Tests for bot inline buttons and callbacks."""
 
+    __slots__ = ("_menu_message",)
+
+    def __init__(
+        self,
+        client: "BotTesterClient",
+        extra_clients: list["BotTesterClient"] | None = None,
+        on_result: Callable[[TestResult], None] | None = None,
+    ) -> None:
+        """
+        Initialize the test suite.
+
+        Args:
+            client: Bot tester client.
+            extra_clients: Additional started clients for parallel tests.
+            on_result: Called with each test result as soon as it is ready.
+        """
+        super().__init__(client, extra_clients, on_result)
+        # Reply to the last /menu sent by this suite
+        self._menu_message: Any = None
+
+    # Test names and methods, in run order
+    _TESTS = (
+        ("Callback: Main Menu Navigation", "test_main_menu_navigation"),
+        ("Callback: Spreads from Menu", "test_spreads_from_menu"),
+        ("Callback: Alerts from Menu", "test_alerts_from_menu"),
+        ("Callback: Settings from Menu", "test_settings_from_menu"),
+        ("Callback: Home Button", "test_home_button"),
+        ("Callback: Refresh Spreads", "test_refresh_spreads"),
+    )
+
     async def run_all(self) -> list[TestResult]:
         """Run all callback tests."""
-        tests = [
-            ("Callback: Main Menu Navigation", self.test_main_menu_navigation),
-            ("Callback: Spreads from Menu", self.test_spreads_from_menu),
-            ("Callback: Alerts from Menu", self.test_alerts_from_menu),
-            ("Callback: Settings from Menu", self.test_settings_from_menu),
-            ("Callback: Home Button", self.test_home_button),
-            ("Callback: Refresh Spreads", self.test_refresh_spreads),
-        ]
-
-        results = []
-        for name, test_func in tests:
-            result = await self.run_test(name, test_func)
-            results.append(result)
-            await self.delay()
-
-        return results
+        # Each test starts from /start, /menu or a direct command
+        return await self.run_tests(self._TESTS)
+
+    async def open_menu(self) -> None:
+        """
+        Show the main menu, reusing the one on screen if nothing changed.
+
+        /menu is only sent when the client's last message is no longer the
+        menu this suite opened, e.g. a previous test clicked a button (the
+        bot's edit replaces the last message). A test skipped before
+        clicking leaves the menu in place for the next one.
+        """
+        if (
+            self._menu_message is not None
+            and self.client.last_message is self._menu_message
+        ):
+            return
+
+        await self.client.send_command("/menu")
+        self.assert_response_received()
+        self._menu_message = self.client.last_message
 
     async def test_main_menu_navigation(self) -> TestResult:
         """Test main menu buttons are present after /start."""
@@ -44,13 +94,13 @@ class CallbackTests(BaseTest):
                 message=f"Expected at least 2 menu buttons, got {len(buttons)}",
             )
 
-        # Check for expected buttons
-        button_texts = [b["text"].lower() for b in buttons]
-        expected_buttons = ["spread", "alert", "setting"]
-
-        found = sum(1 for exp in expected_buttons if any(exp in text for text in button_texts))
+        # Check for expected buttons; the separator keeps a keyword from
+        # matching across two buttons, and one lower() covers all texts
+        joined = "\0".join(b["text"] for b in buttons).lower()
+        found = sum(1 for exp in _MAIN_MENU_KEYWORDS if exp in joined)
 
         if found < 2:
+            button_texts = joined.split("\0")
             return TestResult(
                 name="test_main_menu_navigation",
                 status=TestStatus.FAILED,
@@ -61,30 +111,27 @@ class CallbackTests(BaseTest):
             name="test_main_menu_navigation",
             status=TestStatus.PASSED,
             message=f"Found {len(buttons)} menu buttons",
-            details={"buttons": button_texts},
+            details={"buttons": joined.split("\0")},
         )
 
     async def test_spreads_from_menu(self) -> TestResult:
         """Test clicking spreads button from menu."""
-        await self.client.send_command("/menu")
-        self.assert_response_received()
+        await self.open_menu()
 
         # Find and click spreads button
-        if not self.client.has_button(data_contains="spreads"):
+        button = self.find_button(data_contains="spreads")
+        if button is None:
             return TestResult(
                 name="test_spreads_from_menu",
                 status=TestStatus.SKIPPED,
                 message="Spreads button not found in menu",
             )
 
-        await self.client.click_button(data_contains="spreads")
+        await self.client.click_button(button_text=button["text"])
         await self.delay(1)
 
-        text = self.client.last_text.lower()
-        has_spreads = any(
-            word in text
-            for word in ["spread", "funding", "📊", "no", "loading", "fetching"]
-        )
+        text = self.client.last_text_lower
+        has_spreads = _SPREADS_VIEW(text)
 
         if not has_spreads:
             return TestResult(
@@ -101,25 +148,22 @@ class CallbackTests(BaseTest):
 
     async def test_alerts_from_menu(self) -> TestResult:
         """Test clicking alerts button from menu."""
-        await self.client.send_command("/menu")
-        self.assert_response_received()
+        await self.open_menu()
 
         # Find and click alerts button
-        if not self.client.has_button(data_contains="alerts"):
+        button = self.find_button(data_contains="alerts")
+        if button is None:
             return TestResult(
                 name="test_alerts_from_menu",
                 status=TestStatus.SKIPPED,
                 message="Alerts button not found in menu",
             )
 
-        await self.client.click_button(data_contains="alerts")
+        await self.client.click_button(button_text=button["text"])
         await self.delay(1)
 
-        text = self.client.last_text.lower()
-        has_alerts = any(
-            word in text
-            for word in ["alert", "🔔", "no alerts", "your alerts"]
-        )
+        text = self.client.last_text_lower
+        has_alerts = _ALERTS_VIEW(text)
 
         if not has_alerts:
             return TestResult(
@@ -136,25 +180,22 @@ class CallbackTests(BaseTest):
 
     async def test_settings_from_menu(self) -> TestResult:
         """Test clicking settings button from menu."""
-        await self.client.send_command("/menu")
-        self.assert_response_received()
+        await self.open_menu()
 
         # Find and click settings button
-        if not self.client.has_button(data_contains="settings"):
+        button = self.find_button(data_contains="settings")
+        if button is None:
             return TestResult(
                 name="test_settings_from_menu",
                 status=TestStatus.SKIPPED,
                 message="Settings button not found in menu",
             )
 
-        await self.client.click_button(data_contains="settings")
+        await self.client.click_button(button_text=button["text"])
         await self.delay(1)
 
-        text = self.client.last_text.lower()
-        has_settings = any(
-            word in text
-            for word in ["setting", "language", "timezone", "⚙️"]
-        )
+        text = self.client.last_text_lower
+        has_settings = _SETTINGS_VIEW(text)
 
         if not has_settings:
             return TestResult(
@@ -176,7 +217,8 @@ class CallbackTests(BaseTest):
         self.assert_response_received()
 
         # Find and click home button
-        if not self.client.has_button(text="🏠") and not self.client.has_button(data_contains="home"):
+        button = self.find_button(text="🏠") or self.find_button(data_contains="home")
+        if button is None:
             return TestResult(
                 name="test_home_button",
                 status=TestStatus.SKIPPED,
@@ -184,10 +226,7 @@ class CallbackTests(BaseTest):
             )
 
         try:
-            if self.client.has_button(text="🏠"):
-                await self.client.click_button(text="🏠")
-            else:
-                await self.client.click_button(data_contains="home")
+            await self.client.click_button(button_text=button["text"])
         except Exception as e:
             return TestResult(
                 name="test_home_button",
@@ -219,7 +258,11 @@ class CallbackTests(BaseTest):
         self.assert_response_received()
 
         # Find and click refresh button
-        if not self.client.has_button(text="🔄") and not self.client.has_button(data_contains="refresh"):
+        button = (
+            self.find_button(text="🔄")
+            or self.find_button(data_contains="refresh")
+        )
+        if button is None:
             return TestResult(
                 name="test_refresh_spreads",
                 status=TestStatus.SKIPPED,
@@ -227,10 +270,7 @@ class CallbackTests(BaseTest):
             )
 
         try:
-            if self.client.has_button(text="��"):
-                await self.client.click_button(text="🔄")
-            else:
-                await self.client.click_button(data_contains="refresh")
+            await self.client.click_button(button_text=button["text"])
         except Exception as e:
             return TestResult(
                 name="test_refresh_spreads",
@@ -241,11 +281,8 @@ class CallbackTests(BaseTest):
         await self.delay(2)
 
         # Should still show spreads
-        text = self.client.last_text.lower()
-        has_spreads = any(
-            word in text
-            for word in ["spread", "funding", "📊", "no"]
-        )
+        text = self.client.last_text_lower
+        has_spreads = _REFRESHED_SPREADS_VIEW(text)
 
         if not has_spreads:
             return TestResult(
@@ -2,45 +2,51 @@
 Command tests for a_bot.
 """
 
-from .base import BaseTest
+from .base import BaseTest, keywords
 from ..utils.report import TestResult, TestStatus
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Markers of the expected reply in the lowercased message text
+_WELCOME = keywords("welcome", "привет", "👋", "hello")
+_HELP = keywords("help", "command", "помощь", "/")
+_SPREADS = keywords("spread", "funding", "спред", "fetching", "loading", "📊", "no")
+_ALERTS = keywords("alert", "оповещ", "🔔", "no alerts", "your alerts")
+_ALERT_CREATION = keywords("alert", "create", "symbol", "spread", "select", "choose")
+_SETTINGS = keywords("setting", "настрой", "language", "timezone", "⚙️")
+
 
 class CommandTests(BaseTest):
     """Tests for bot commands."""
 
+    __slots__ = ()
+
+    # Test names and methods, in run order
+    _TESTS = (
+        ("Command: /start", "test_start_command"),
+        ("Command: /help", "test_help_command"),
+        ("Command: /menu", "test_menu_command"),
+        ("Command: /spreads", "test_spreads_command"),
+        ("Command: /alerts", "test_alerts_command"),
+        ("Command: /newalert", "test_newalert_command"),
+        ("Command: /settings", "test_settings_command"),
+    )
+
     async def run_all(self) -> list[TestResult]:
         """Run all command tests."""
-        tests = [
-            ("Command: /start", self.test_start_command),
-            ("Command: /help", self.test_help_command),
-            ("Command: /menu", self.test_menu_command),
-            ("Command: /spreads", self.test_spreads_command),
-            ("Command: /alerts", self.test_alerts_command),
-            ("Command: /newalert", self.test_newalert_command),
-            ("Command: /settings", self.test_settings_command),
-        ]
-
-        results = []
-        for name, test_func in tests:
-            result = await self.run_test(name, test_func)
-            results.append(result)
-            await self.delay()
-
-        return results
+        # Each test sends its own command, so they can share out the sessions
+        return await self.run_tests(self._TESTS)
 
     async def test_start_command(self) -> TestResult:
         """Test /start command."""
-        response = await self.client.send_command("/start")
+        await self.send_command_memo("/start", fresh=True)
 
         self.assert_response_received()
 
         # Check for welcome message elements
-        text = self.client.last_text.lower()
-        has_welcome = any(word in text for word in ["welcome", "привет", "👋", "hello"])
+        text = self.client.last_text_lower
+        has_welcome = _WELCOME(text)
 
         if not has_welcome:
             return TestResult(
@@ -61,14 +67,14 @@ class CommandTests(BaseTest):
 
     async def test_help_command(self) -> TestResult:
         """Test /help command."""
-        response = await self.client.send_command("/help")
+        await self.send_command_memo("/help", fresh=True)
 
         self.assert_response_received()
 
-        text = self.client.last_text.lower()
+        text = self.client.last_text_lower
 
         # Check for help content
-        has_help = any(word in text for word in ["help", "command", "помощь", "/"])
+        has_help = _HELP(text)
 
         if not has_help:
             return TestResult(
@@ -85,7 +91,7 @@ class CommandTests(BaseTest):
 
     async def test_menu_command(self) -> TestResult:
         """Test /menu command."""
-        response = await self.client.send_command("/menu")
+        await self.send_command_memo("/menu", fresh=True)
 
         self.assert_response_received()
 
@@ -107,17 +113,14 @@ class CommandTests(BaseTest):
 
     async def test_spreads_command(self) -> TestResult:
         """Test /spreads command."""
-        response = await self.client.send_command("/spreads")
+        await self.send_command_memo("/spreads", fresh=True)
 
         self.assert_response_received()
 
-        text = self.client.last_text.lower()
+        text = self.client.last_text_lower
 
         # Should contain spread-related content or "fetching" message
-        has_spreads = any(
-            word in text
-            for word in ["spread", "funding", "спред", "fetching", "loading", "📊", "no"]
-        )
+        has_spreads = _SPREADS(text)
 
         if not has_spreads:
             return TestResult(
@@ -134,17 +137,14 @@ class CommandTests(BaseTest):
 
     async def test_alerts_command(self) -> TestResult:
         """Test /alerts command."""
-        response = await self.client.send_command("/alerts")
+        await self.send_command_memo("/alerts", fresh=True)
 
         self.assert_response_received()
 
-        text = self.client.last_text.lower()
+        text = self.client.last_text_lower
 
         # Should contain alerts-related content
-        has_alerts = any(
-            word in text
-            for word in ["alert", "оповещ", "🔔", "no alerts", "your alerts"]
-        )
+        has_alerts = _ALERTS(text)
 
         if not has_alerts:
             return TestResult(
@@ -161,17 +161,14 @@ class CommandTests(BaseTest):
 
     async def test_newalert_command(self) -> TestResult:
         """Test /newalert command starts alert creation."""
-        response = await self.client.send_command("/newalert")
+        await self.client.send_command("/newalert")
 
         self.assert_response_received()
 
-        text = self.client.last_text.lower()
+        text = self.client.last_text_lower
 
         # Should start alert creation flow
-        has_creation = any(
-            word in text
-            for word in ["alert", "create", "symbol", "spread", "select", "choose"]
-        )
+        has_creation = _ALERT_CREATION(text)
 
         if not has_creation:
             return TestResult(
@@ -180,12 +177,7 @@ class CommandTests(BaseTest):
                 message=f"Expected alert creation flow, got: {text[:200]}",
             )
 
-        # Cancel the flow to clean up
-        if self.client.has_button(text="Cancel") or self.client.has_button(data_contains="cancel"):
-            try:
-                await self.client.click_button(text="Cancel")
-            except Exception:
-                pass
+        # The flow is left open: every test starts with its own command
 
         return TestResult(
             name="test_newalert_command",
@@ -195,17 +187,14 @@ class CommandTests(BaseTest):
 
     async def test_settings_command(self) -> TestResult:
         """Test /settings command."""
-        response = await self.client.send_command("/settings")
+        await self.send_command_memo("/settings", fresh=True)
 
         self.assert_response_received()
 
-        text = self.client.last_text.lower()
+        text = self.client.last_text_lower
 
         # Should contain settings-related content
-        has_settings = any(
-            word in text
-            for word in ["setting", "настрой", "language", "timezone", "⚙️"]
-        )
+        has_settings = _SETTINGS(text)
 
         if not has_settings:
             return TestResult(
@@ -2,60 +2,55 @@
 Conversation flow tests for a_bot.
 """
 
-from .base import BaseTest
+from .base import BaseTest, keywords
 from ..utils.report import TestResult, TestStatus
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Markers of the expected reply in the lowercased message text
+_LANGUAGE_OPTIONS = keywords("language", "english", "русский", "язык")
+_ALERT_CREATION = keywords("alert", "create", "symbol", "spread", "select")
+_CANCELLED = keywords("cancel", "отмен", "menu", "меню")
+
 
 class FlowTests(BaseTest):
     """Tests for multi-step conversation flows."""
 
+    __slots__ = ()
+
+    # Test names and methods of the flows that can run in any order
+    _INDEPENDENT_TESTS = (
+        ("Flow: Language Change", "test_language_change_flow"),
+        ("Flow: Alert Creation Cancellation", "test_alert_creation_cancel"),
+    )
+
     async def run_all(self) -> list[TestResult]:
         """Run all flow tests."""
-        tests = [
-            ("Flow: Complete User Journey", self.test_complete_user_journey),
-            ("Flow: Language Change", self.test_language_change_flow),
-            ("Flow: Alert Creation Cancellation", self.test_alert_creation_cancel),
-        ]
-
-        results = []
-        for name, test_func in tests:
-            result = await self.run_test(name, test_func)
-            results.append(result)
-            await self.delay()
+        # The journey goes first, on this suite's own session
+        journey = await self.run_test(
+            "Flow: Complete User Journey", self.test_complete_user_journey
+        )
+        await self.pause_after(journey)
 
-        return results
+        # The settings and alert creation flows don't depend on each other,
+        # so they can run on separate sessions
+        return [journey, *await self.run_tests(self._INDEPENDENT_TESTS)]
 
     async def test_complete_user_journey(self) -> TestResult:
         """Test a complete user journey through the bot."""
         steps_completed = []
 
         try:
-            # Step 1: Start the bot
-            await self.client.send_command("/start")
-            self.assert_response_received()
-            steps_completed.append("start")
-            await self.delay(1)
-
-            # Step 2: Check spreads
-            await self.client.send_command("/spreads")
-            self.assert_response_received()
-            steps_completed.append("spreads")
-            await self.delay(1)
-
-            # Step 3: Check alerts
-            await self.client.send_command("/alerts")
-            self.assert_response_received()
-            steps_completed.append("alerts")
-            await self.delay(1)
-
-            # Step 4: Check settings
-            await self.client.send_command("/settings")
-            self.assert_response_received()
-            steps_completed.append("settings")
-            await self.delay(1)
+            # Steps 1-4: start the bot, check spreads, alerts and settings;
+            # replies already seen by the command tests are reused
+            for command in ("/start", "/spreads", "/alerts", "/settings"):
+                sent_before = self.client.requests_sent
+                await self.send_command_memo(command)
+                self.assert_response_received()
+                steps_completed.append(command[1:])
+                if self.client.requests_sent > sent_before:
+                    await self.delay(1)
 
             # Step 5: Return to menu
             await self.client.send_command("/menu")
@@ -83,7 +78,8 @@ class FlowTests(BaseTest):
         self.assert_response_received()
 
         # Look for language button
-        if not self.client.has_button(data_contains="lang"):
+        lang_button = self.find_button(data_contains="lang")
+        if lang_button is None:
             return TestResult(
                 name="test_language_change_flow",
                 status=TestStatus.SKIPPED,
@@ -92,15 +88,12 @@ class FlowTests(BaseTest):
 
         try:
             # Click language button
-            await self.client.click_button(data_contains="lang")
+            await self.client.click_button(button_text=lang_button["text"])
             await self.delay(1)
 
             # Should show language options
-            text = self.client.last_text.lower()
-            has_lang_options = any(
-                word in text
-                for word in ["language", "english", "русский", "язык"]
-            )
+            text = self.client.last_text_lower
+            has_lang_options = _LANGUAGE_OPTIONS(text)
 
             if not has_lang_options:
                 return TestResult(
@@ -110,12 +103,13 @@ class FlowTests(BaseTest):
                 )
 
             # Go back to settings or home
-            if self.client.has_button(text="⬅️") or self.client.has_button(data_contains="back"):
+            back_button = (
+                self.find_button(text="⬅️")
+                or self.find_button(data_contains="back")
+            )
+            if back_button is not None:
                 try:
-                    if self.client.has_button(text="⬅️"):
-                        await self.client.click_button(text="⬅️")
-                    else:
-                        await self.client.click_button(data_contains="back")
+                    await self.client.click_button(button_text=back_button["text"])
                 except Exception:
                     pass
 
@@ -138,11 +132,8 @@ class FlowTests(BaseTest):
         self.assert_response_received()
 
         # Should be in alert creation flow
-        text = self.client.last_text.lower()
-        in_flow = any(
-            word in text
-            for word in ["alert", "create", "symbol", "spread", "select"]
-        )
+        text = self.client.last_text_lower
+        in_flow = _ALERT_CREATION(text)
 
         if not in_flow:
             return TestResult(
@@ -152,24 +143,17 @@ class FlowTests(BaseTest):
             )
 
         # Try to cancel
-        cancel_button_found = False
-        if self.client.has_button(text="Cancel") or self.client.has_button(text="❌"):
-            cancel_button_found = True
-            try:
-                if self.client.has_button(text="Cancel"):
-                    await self.client.click_button(text="Cancel")
-                else:
-                    await self.client.click_button(text="❌")
-            except Exception:
-                pass
-        elif self.client.has_button(data_contains="cancel"):
-            cancel_button_found = True
+        cancel_button = (
+            self.find_button(text="Cancel")
+            or self.find_button(text="❌")
+            or self.find_button(data_contains="cancel")
+        )
+        if cancel_button is not None:
             try:
-                await self.client.click_button(data_contains="cancel")
+                await self.client.click_button(button_text=cancel_button["text"])
             except Exception:
                 pass
-
-        if not cancel_button_found:
+        else:
             return TestResult(
                 name="test_alert_creation_cancel",
                 status=TestStatus.SKIPPED,
@@ -179,11 +163,8 @@ class FlowTests(BaseTest):
         await self.delay(1)
 
         # Should be cancelled
-        text = self.client.last_text.lower()
-        cancelled = any(
-            word in text
-            for word in ["cancel", "отмен", "menu", "меню"]
-        )
+        text = self.client.last_text_lower
+        cancelled = _CANCELLED(text)
 
         if cancelled:
             return TestResult(
@@ -1,6 +1,16 @@
 """Utility modules."""
 
+from typing import Any
+
 from .logging import get_logger, setup_logging
-from .report import TestReport, TestResult
 
 __all__ = ["get_logger", "setup_logging", "TestReport", "TestResult"]
+
+
+def __getattr__(name: str) -> Any:
+    # The report module pulls in rich, so it is only imported when used
+    if name in ("TestReport", "TestResult"):
+        from . import report
+
+        return getattr(report, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,55 @@
+"""
+Run-scoped cache of bot replies to commands.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Bot reply to a command, as last seen in one chat."""
+
+    message: Any
+    # Chat state (BotTesterClient.state_changes) the reply was received in
+    state: int
+
+
+# Keyed by (command, chat), where chat identifies the session and the bot
+_responses: dict[tuple[str, str], CachedResponse] = {}
+
+
+def get_response(command: str, chat: str, state: int) -> CachedResponse | None:
+    """
+    Get the cached reply to a command.
+
+    Args:
+        command: Command that was sent (e.g., "/start").
+        chat: Chat the command was sent in.
+        state: Current chat state; replies from another state are stale.
+
+    Returns:
+        Cached reply, or None if there is no fresh one.
+    """
+    cached = _responses.get((command, chat))
+    if cached is None or cached.state != state:
+        return None
+    return cached
+
+
+def store_response(command: str, chat: str, state: int, message: Any) -> None:
+    """
+    Cache the reply to a command.
+
+    Args:
+        command: Command that was sent.
+        chat: Chat the command was sent in.
+        state: Chat state the reply was received in.
+        message: Bot's reply.
+    """
+    _responses[(command, chat)] = CachedResponse(message=message, state=state)
+
+
+def clear_responses() -> None:
+    """Forget all cached replies, e.g. at the start of a test run."""
+    _responses.clear()
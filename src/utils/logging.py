@@ -2,27 +2,86 @@
 Logging configuration using structlog.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
 
 import structlog
-from rich.console import Console
-from rich.logging import RichHandler
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Queue handler passing records through unformatted.
+
+    The listener runs in this process, so records needn't be made picklable;
+    formatting them here would defeat the point of the queue.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _FromStructlog(logging.Filter):
+    """Pass only records logged through structlog (or only the others)."""
+
+    def __init__(self, structlog_records: bool) -> None:
+        super().__init__()
+        self.structlog_records = structlog_records
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return hasattr(record, "_logger") == self.structlog_records
+
+
+def _capture_exc_info(
+    logger: Any,
+    method_name: str,
+    event_dict: structlog.types.EventDict,
+) -> structlog.types.EventDict:
+    """Resolve exc_info=True while the exception is still being handled."""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
 
 
 def setup_logging(level: str = "INFO") -> None:
     """
     Configure structured logging.
 
+    Log calls only enqueue the record; rendering and writing to stderr
+    happen on a listener thread, so they don't block the event loop.
+
     Args:
         level: Logging level.
     """
-    # Configure stdlib logging
-    logging.basicConfig(
-        format="%(message)s",
-        level=getattr(logging, level.upper(), logging.INFO),
-        handlers=[RichHandler(console=Console(stderr=True), rich_tracebacks=True)],
+    # Imported here so importing get_logger doesn't pull in rich
+    from rich.console import Console
+    from rich.logging import RichHandler
+
+    log_level = getattr(logging, level.upper(), logging.INFO)
+
+    structlog_handler = logging.StreamHandler(sys.stderr)
+    structlog_handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            processor=structlog.dev.ConsoleRenderer(colors=True),
+        )
     )
+    structlog_handler.addFilter(_FromStructlog(True))
+
+    # Other libraries (e.g. Telethon) log through stdlib logging
+    stdlib_handler = RichHandler(console=Console(stderr=True), rich_tracebacks=True)
+    stdlib_handler.setFormatter(logging.Formatter("%(message)s"))
+    stdlib_handler.addFilter(_FromStructlog(False))
+
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(records, structlog_handler, stdlib_handler)
+    listener.start()
+    # Flush what is still queued on exit
+    atexit.register(listener.stop)
+
+    # Configure stdlib logging
+    logging.basicConfig(level=log_level, handlers=[_RecordQueueHandler(records)])
 
     # Configure structlog
     structlog.configure(
@@ -30,13 +89,12 @@ def setup_logging(level: str = "INFO") -> None:
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer(colors=True),
+            _capture_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, level.upper(), logging.INFO)
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
@@ -45,6 +103,10 @@ def get_logger(name: str) -> structlog.BoundLogger:
     """
     Get a configured logger.
 
+    structlog returns a lazy proxy: the logger is only bound on the first
+    log call (and cached from then on), so module-level loggers cost
+    nothing at import time and pick up setup_logging() done later.
+
     Args:
         name: Logger name.
 
@@ -2,14 +2,22 @@
 Test reporting utilities.
 """
 
-from dataclasses import dataclass, field
+import json
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 from rich import box
 
 
@@ -22,7 +30,23 @@ class TestStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+# Status column cells of the detailed table
+_STATUS_CELLS = {
+    TestStatus.PASSED: Text("✅ PASS", style="green"),
+    TestStatus.FAILED: Text("❌ FAIL", style="red"),
+    TestStatus.SKIPPED: Text("⏭️ SKIP", style="yellow"),
+    TestStatus.ERROR: Text("💥 ERR", style="magenta"),
+}
+
+
+def _clip(text: str, width: int = 40) -> str:
+    """Cut text to width characters, marking the cut with '...'."""
+    if len(text) <= width:
+        return text
+    return f"{text[:width]}..."
+
+
+@dataclass(slots=True)
 class TestResult:
     """Individual test result."""
 
@@ -31,30 +55,110 @@ class TestResult:
     duration_ms: float = 0.0
     message: str = ""
     details: dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Creation time in nanoseconds since the epoch; see timestamp
+    created_ns: int = field(default_factory=time.time_ns)
+    # Whether the test sent anything to the bot
+    outgoing: bool = False
+    # Name the test was run under (results may carry a different name)
+    test_id: str = ""
+    # Bot replies the test got, in order: {"text", "buttons"} dicts, or
+    # None where no reply came; enough to re-judge the test offline
+    raw_responses: list[dict[str, Any] | None] = field(default_factory=list)
 
     @property
     def passed(self) -> bool:
         """Check if test passed."""
         return self.status == TestStatus.PASSED
 
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a local datetime."""
+        return datetime.fromtimestamp(self.created_ns / 1e9)
+
 
-@dataclass
+@dataclass(slots=True)
 class TestReport:
     """Aggregated test report."""
 
     results: list[TestResult] = field(default_factory=list)
     started_at: datetime = field(default_factory=datetime.now)
     finished_at: datetime | None = None
+    # Username of the bot the tests ran against
+    bot: str = ""
+    # Running totals over results, kept up to date by add_result
+    _status_counts: Counter[TestStatus] = field(
+        default_factory=Counter, init=False, repr=False
+    )
+    _duration_sum: float = field(default=0.0, init=False, repr=False)
+    # Live summary display, while live() is active
+    _live: Live | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Count the results the report was created with."""
+        for result in self.results:
+            self._count(result)
 
     def add_result(self, result: TestResult) -> None:
         """Add a test result."""
         self.results.append(result)
+        self._count(result)
+        if self._live is not None:
+            # Redraws are throttled by the display's refresh rate
+            self._live.update(self._summary_table())
+
+    def _count(self, result: TestResult) -> None:
+        """Add a result to the running totals."""
+        self._status_counts[result.status] += 1
+        self._duration_sum += result.duration_ms
 
     def finish(self) -> None:
         """Mark report as finished."""
         self.finished_at = datetime.now()
 
+    def save(self, path: Path) -> None:
+        """
+        Save the report, including the bot replies, as JSON.
+
+        Args:
+            path: Output file path.
+        """
+        data = {k: v for k, v in asdict(self).items() if not k.startswith("_")}
+        path.write_text(json.dumps(data, default=str, ensure_ascii=False))
+
+    @classmethod
+    def load(cls, path: Path) -> "TestReport":
+        """
+        Load a report saved with save().
+
+        Args:
+            path: Report file path.
+
+        Returns:
+            Loaded report.
+        """
+        data = json.loads(path.read_text())
+        known = {f.name for f in fields(TestResult)}
+        results = []
+        for item in data["results"]:
+            item = {k: v for k, v in item.items() if k in known}
+            item["status"] = TestStatus(item["status"])
+            results.append(TestResult(**item))
+
+        finished_at = data.get("finished_at")
+        return cls(
+            results=results,
+            started_at=datetime.fromisoformat(data["started_at"]),
+            finished_at=datetime.fromisoformat(finished_at) if finished_at else None,
+            bot=data.get("bot", ""),
+        )
+
+    def responses_by_test(self) -> dict[str, list[dict[str, Any] | None]]:
+        """Get the recorded bot replies of each test, by test name."""
+        return {
+            result.test_id or result.name: result.raw_responses
+            for result in self.results
+        }
+
     @property
     def total(self) -> int:
         """Total number of tests."""
@@ -63,22 +167,22 @@ class TestReport:
     @property
     def passed(self) -> int:
         """Number of passed tests."""
-        return sum(1 for r in self.results if r.status == TestStatus.PASSED)
+        return self._status_counts[TestStatus.PASSED]
 
     @property
     def failed(self) -> int:
         """Number of failed tests."""
-        return sum(1 for r in self.results if r.status == TestStatus.FAILED)
+        return self._status_counts[TestStatus.FAILED]
 
     @property
     def skipped(self) -> int:
         """Number of skipped tests."""
-        return sum(1 for r in self.results if r.status == TestStatus.SKIPPED)
+        return self._status_counts[TestStatus.SKIPPED]
 
     @property
     def errors(self) -> int:
         """Number of error tests."""
-        return sum(1 for r in self.results if r.status == TestStatus.ERROR)
+        return self._status_counts[TestStatus.ERROR]
 
     @property
     def success_rate(self) -> float:
@@ -90,13 +194,32 @@ class TestReport:
     @property
     def total_duration_ms(self) -> float:
         """Total duration in milliseconds."""
-        return sum(r.duration_ms for r in self.results)
+        return self._duration_sum
 
-    def print_summary(self, console: Console | None = None) -> None:
-        """Print formatted test summary."""
-        if console is None:
-            console = Console()
+    @contextmanager
+    def live(self, console: Console | None = None) -> Iterator[None]:
+        """
+        Show the summary table, updated as results are added, in the block.
+
+        The display is cleared on exit; print the final summary after it.
 
+        Args:
+            console: Console to draw on.
+        """
+        with Live(
+            self._summary_table(),
+            console=console,
+            refresh_per_second=4,
+            transient=True,
+        ) as live:
+            self._live = live
+            try:
+                yield
+            finally:
+                self._live = None
+
+    def _summary_table(self) -> Table:
+        """Build the summary table."""
         # Create summary table
         table = Table(
             title="🧪 Test Results Summary",
@@ -107,21 +230,35 @@ class TestReport:
         table.add_column("Metric", style="bold")
         table.add_column("Value", justify="right")
 
-        table.add_row("Total Tests", str(self.total))
-        table.add_row("✅ Passed", f"[green]{self.passed}[/green]")
-        table.add_row("❌ Failed", f"[red]{self.failed}[/red]")
-        table.add_row("⏭️ Skipped", f"[yellow]{self.skipped}[/yellow]")
-        table.add_row("💥 Errors", f"[magenta]{self.errors}[/magenta]")
-        table.add_row("📊 Success Rate", f"{self.success_rate:.1f}%")
-        table.add_row("⏱️ Total Duration", f"{self.total_duration_ms:.0f}ms")
+        # Styled Text values, so Rich has no markup to parse
+        rows = (
+            ("Total Tests", Text(str(self.total))),
+            ("✅ Passed", Text(str(self.passed), style="green")),
+            ("❌ Failed", Text(str(self.failed), style="red")),
+            ("⏭️ Skipped", Text(str(self.skipped), style="yellow")),
+            ("💥 Errors", Text(str(self.errors), style="magenta")),
+            ("📊 Success Rate", Text(f"{self.success_rate:.1f}%")),
+            ("⏱️ Total Duration", Text(f"{self.total_duration_ms:.0f}ms")),
+        )
+        for metric, value in rows:
+            table.add_row(metric, value)
+
+        return table
+
+    def print_summary(self, console: Console | None = None) -> None:
+        """Print formatted test summary."""
+        if console is None:
+            console = Console()
 
+        table = self._summary_table()
         console.print(table)
 
-        # Print failed tests details
-        failed_results = [r for r in self.results if r.status in (TestStatus.FAILED, TestStatus.ERROR)]
-        if failed_results:
+        # Print failed tests details; the counts say whether there are any
+        if self.failed or self.errors:
             console.print("\n[bold red]Failed Tests:[/bold red]")
-            for result in failed_results:
+            for result in self.results:
+                if result.status not in (TestStatus.FAILED, TestStatus.ERROR):
+                    continue
                 console.print(Panel(
                     f"[bold]{result.name}[/bold]\n"
                     f"Status: {result.status.value}\n"
@@ -146,20 +283,14 @@ class TestReport:
         table.add_column("Duration", justify="right", width=10)
         table.add_column("Message", max_width=40)
 
-        status_styles = {
-            TestStatus.PASSED: "[green]✅ PASS[/green]",
-            TestStatus.FAILED: "[red]❌ FAIL[/red]",
-            TestStatus.SKIPPED: "[yellow]⏭️ SKIP[/yellow]",
-            TestStatus.ERROR: "[magenta]💥 ERR[/magenta]",
-        }
-
         for i, result in enumerate(self.results, 1):
             table.add_row(
                 str(i),
-                result.name,
-                status_styles.get(result.status, result.status.value),
+                Text(result.name),
+                _STATUS_CELLS.get(result.status, result.status.value),
                 f"{result.duration_ms:.0f}ms",
-                result.message[:40] + "..." if len(result.message) > 40 else result.message,
+                # Plain Text: test names and messages aren't markup
+                Text(_clip(result.message)),
             )
 
         console.print(table)
@@ -0,0 +1,141 @@
+"""
+Event loop runner for the command line entry points.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from typing import Any, Callable, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # optional: falls back to the default asyncio loop
+    uvloop = None
+
+T = TypeVar("T")
+
+# Bytes read from stdin past the last line returned by read_stdin_line
+_stdin_buffer = bytearray()
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a fresh event loop.
+
+    Uses uvloop's libuv-based loop when it is installed.
+
+    Args:
+        main: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
+def enable_eager_tasks() -> None:
+    """
+    Start new tasks on the running loop eagerly (Python 3.12+).
+
+    An eager task runs synchronously until its first real suspension, so
+    coroutines that finish without waiting never go through the scheduler.
+    Does nothing on older Pythons.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is not None:
+        asyncio.get_running_loop().set_task_factory(factory)
+
+
+async def run_blocking_input(read: Callable[..., T], *args: Any) -> T:
+    """
+    Call a blocking stdin reader without blocking the event loop.
+
+    The reader runs on a daemon thread, so updates keep being processed
+    while the user types, and a pending read isn't joined on exit (unlike
+    the default executor). A thread still blocked in input() at interpreter
+    shutdown can abort the process, though; prefer read_stdin_line, which
+    only uses this where stdin can't be watched by the event loop.
+
+    Args:
+        read: Blocking function reading from stdin (e.g. input, Prompt.ask).
+        *args: Arguments for read.
+
+    Returns:
+        What read returned; its exceptions (e.g. EOFError) are re-raised.
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[T] = loop.create_future()
+
+    def resolve(result: Any, error: BaseException | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def worker() -> None:
+        try:
+            result = read(*args)
+        except BaseException as e:
+            loop.call_soon_threadsafe(resolve, None, e)
+        else:
+            loop.call_soon_threadsafe(resolve, result, None)
+
+    threading.Thread(target=worker, daemon=True).start()
+    return await future
+
+
+async def read_stdin_line() -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    On POSIX the event loop watches stdin and the line is read from it
+    directly, so a cancelled read (e.g. on Ctrl+C) leaves nothing blocked
+    on stdin. Elsewhere input() runs on a thread (see run_blocking_input).
+    Print any prompt before calling this.
+
+    Returns:
+        The line, without the line break.
+
+    Raises:
+        EOFError: If stdin is closed.
+    """
+    try:
+        fd = sys.stdin.fileno()
+    except (AttributeError, OSError, ValueError):
+        fd = None
+    if fd is None or sys.platform == "win32":
+        return await run_blocking_input(input)
+
+    while (end := _stdin_buffer.find(b"\n")) < 0:
+        chunk = await _read_when_ready(fd)
+        if not chunk:
+            if not _stdin_buffer:
+                raise EOFError
+            end = len(_stdin_buffer)
+            break
+        _stdin_buffer.extend(chunk)
+
+    line = _stdin_buffer[:end].decode(errors="replace")
+    del _stdin_buffer[: end + 1]
+    return line.rstrip("\r")
+
+
+async def _read_when_ready(fd: int) -> bytes:
+    """Wait until a file descriptor is readable, then read what is there."""
+    loop = asyncio.get_running_loop()
+    ready: asyncio.Future[None] = loop.create_future()
+    try:
+        loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+    except (PermissionError, NotImplementedError):
+        # Regular files can't be watched, but reading them doesn't block
+        return os.read(fd, 4096)
+    try:
+        await ready
+    finally:
+        loop.remove_reader(fd)
+    return os.read(fd, 4096)
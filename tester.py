@@ -13,15 +13,38 @@ Usage:
 
 import argparse
 import asyncio
+import json
+import logging
 import os
+import queue
 import sys
+import threading
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import IO, Any
 
 from dotenv import load_dotenv
-from telethon import TelegramClient
+from telethon import TelegramClient, events, utils
+from telethon.errors import FloodWaitError
+from telethon.tl.functions.messages import SendMessageRequest
 from telethon.tl.types import Message
 
+try:
+    import ahocorasick
+except ImportError:  # optional: falls back to one substring scan per keyword
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # optional: falls back to the default asyncio loop
+    uvloop = None
+
 load_dotenv()
 
 # Configuration
@@ -30,68 +53,297 @@ API_HASH = os.getenv("TELEGRAM_API_HASH")
 BOT_USERNAME = os.getenv("BOT_USERNAME", "@your_bot")
 SESSION_NAME = os.getenv("SESSION_NAME", "a_bot_tester")
 
+# Replies are collected until the bot stays quiet for this long (seconds)
+REPLY_QUIET_PERIOD = 0.5
+MAX_REPLIES = 5
+# Time between two commands to the same bot (seconds): starts short, grows
+# when Telegram asks to slow down (FloodWaitError) and shrinks back while
+# it doesn't
+MIN_COMMAND_INTERVAL = 0.1
+MAX_COMMAND_INTERVAL = 30.0
+
+logger = logging.getLogger("tester")
+
+# Result fields kept in memory for the summary; the full results (with the
+# bot's responses) only go to the results log
+SUMMARY_FIELDS = ("command", "description", "success", "errors")
+
+
+@dataclass(slots=True, frozen=True)
+class TestCase:
+    """Expected behaviour of the bot for one command."""
+
+    description: str
+    expected_contains: tuple[str, ...] = ()
+    timeout: int = 30
+
 
 # Test cases for a_bot commands
 TEST_CASES = {
-    "/start": {
-        "description": "Start command - should show welcome message",
-        "expected_contains": ["Funding Rate", "Welcome", "menu", "help"],
-        "timeout": 10,
-    },
-    "/help": {
-        "description": "Help command - should show available commands",
-        "expected_contains": ["help", "command", "/"],
-        "timeout": 10,
-    },
-    "/spreads": {
-        "description": "Spreads command - should show top spreads",
-        "expected_contains": ["spread", "%"],
-        "timeout": 30,
-    },
-    "/rates": {
-        "description": "Rates command - should show funding rates",
-        "expected_contains": ["rate", "funding", "%"],
-        "timeout": 30,
-    },
-    "/exchanges": {
-        "description": "Exchanges command - should show exchange list",
-        "expected_contains": ["exchange", "bybit", "mexc"],
-        "timeout": 15,
-    },
-    "/alerts": {
-        "description": "Alerts command - should show user alerts",
-        "expected_contains": ["alert"],
-        "timeout": 15,
-    },
-    "/settings": {
-        "description": "Settings command - should show user settings",
-        "expected_contains": ["settings", "notification"],
-        "timeout": 15,
-    },
-    "/status": {
-        "description": "Status command - should show system status",
-        "expected_contains": ["status", "running", "online"],
-        "timeout": 15,
-    },
+    "/start": TestCase(
+        description="Start command - should show welcome message",
+        expected_contains=("Funding Rate", "Welcome", "menu", "help"),
+        timeout=10,
+    ),
+    "/help": TestCase(
+        description="Help command - should show available commands",
+        expected_contains=("help", "command", "/"),
+        timeout=10,
+    ),
+    "/spreads": TestCase(
+        description="Spreads command - should show top spreads",
+        expected_contains=("spread", "%"),
+        timeout=30,
+    ),
+    "/rates": TestCase(
+        description="Rates command - should show funding rates",
+        expected_contains=("rate", "funding", "%"),
+        timeout=30,
+    ),
+    "/exchanges": TestCase(
+        description="Exchanges command - should show exchange list",
+        expected_contains=("exchange", "bybit", "mexc"),
+        timeout=15,
+    ),
+    "/alerts": TestCase(
+        description="Alerts command - should show user alerts",
+        expected_contains=("alert",),
+        timeout=15,
+    ),
+    "/settings": TestCase(
+        description="Settings command - should show user settings",
+        expected_contains=("settings", "notification"),
+        timeout=15,
+    ),
+    "/status": TestCase(
+        description="Status command - should show system status",
+        expected_contains=("status", "running", "online"),
+        timeout=15,
+    ),
 }
 
 
+@lru_cache(maxsize=None)
+def _keyword_automaton(keywords: tuple[str, ...]) -> "ahocorasick.Automaton":
+    """Build an Aho-Corasick automaton finding keywords case-insensitively."""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.lower(), keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=None)
+def _lowered_keywords(keywords: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Pair each keyword with its lowercase form."""
+    return tuple((keyword, keyword.lower()) for keyword in keywords)
+
+
+def find_keywords(keywords: tuple[str, ...], responses: list[str]) -> set[str]:
+    """Return the keywords found (case-insensitively) in the responses."""
+    if ahocorasick is None:
+        all_text = " ".join(responses).lower()
+        return {
+            keyword
+            for keyword, lowered in _lowered_keywords(keywords)
+            if lowered in all_text
+        }
+
+    # One pass over each response for all keywords
+    automaton = _keyword_automaton(keywords)
+    found: set[str] = set()
+    for text in responses:
+        found.update(keyword for _, keyword in automaton.iter(text.lower()))
+    return found
+
+
+# Prepare the keywords of the known test cases up front
+for _test_case in TEST_CASES.values():
+    if ahocorasick is not None:
+        _keyword_automaton(_test_case.expected_contains)
+    else:
+        _lowered_keywords(_test_case.expected_contains)
+
+
+# Bytes read from stdin past the last line returned by read_line
+_stdin_buffer = bytearray()
+
+
+async def read_line(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+
+    On POSIX the event loop watches stdin and the line is read from it
+    directly, so incoming updates keep being handled while the user types
+    and a cancelled read (Ctrl+C) leaves nothing blocked on stdin. On
+    Windows input() runs on a daemon thread instead.
+    """
+    print(prompt, end="", flush=True)
+    try:
+        fd = sys.stdin.fileno()
+    except (AttributeError, OSError, ValueError):
+        fd = None
+    if fd is None or sys.platform == "win32":
+        return await _input_on_thread()
+
+    while (end := _stdin_buffer.find(b"\n")) < 0:
+        chunk = await _read_when_ready(fd)
+        if not chunk:
+            if not _stdin_buffer:
+                raise EOFError
+            end = len(_stdin_buffer)
+            break
+        _stdin_buffer.extend(chunk)
+
+    line = _stdin_buffer[:end].decode(errors="replace")
+    del _stdin_buffer[: end + 1]
+    return line.rstrip("\r")
+
+
+async def _read_when_ready(fd: int) -> bytes:
+    """Wait until a file descriptor is readable, then read what is there."""
+    loop = asyncio.get_running_loop()
+    ready: asyncio.Future[None] = loop.create_future()
+    try:
+        loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+    except (PermissionError, NotImplementedError):
+        # Regular files can't be watched, but reading them doesn't block
+        return os.read(fd, 4096)
+    try:
+        await ready
+    finally:
+        loop.remove_reader(fd)
+    return os.read(fd, 4096)
+
+
+async def _input_on_thread() -> str:
+    """Run input() on a daemon thread, where stdin can't be watched.
+
+    The thread isn't joined on exit, but if it is still blocked in input()
+    when the interpreter shuts down, the process may abort.
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def resolve(line: str | None, error: BaseException | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line)
+
+    def worker() -> None:
+        try:
+            line = input()
+        except BaseException as e:  # EOFError, KeyboardInterrupt
+            loop.call_soon_threadsafe(resolve, None, e)
+        else:
+            loop.call_soon_threadsafe(resolve, line, None)
+
+    threading.Thread(target=worker, daemon=True).start()
+    return await future
+
+
+# Telethon clients shared by the BotTesters using the same session, with the
+# number of started testers using each; one session file can't back two
+# connected clients at once
+_CLIENTS: dict[tuple[int, str, str], TelegramClient] = {}
+_CLIENT_USERS: dict[tuple[int, str, str], int] = {}
+
+
+def _dump_json_line(obj: Any) -> bytes:
+    """Serialize an object to a single JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, ensure_ascii=False).encode() + b"\n"
+
+
 class BotTester:
     """Telegram bot tester using Telethon."""
 
-    def __init__(self, api_id: str, api_hash: str, session_name: str):
-        """Initialize the tester."""
-        self.client = TelegramClient(session_name, int(api_id), api_hash)
+    def __init__(
+        self,
+        api_id: str,
+        api_hash: str,
+        session_name: str,
+        results_path: str | None = None,
+    ):
+        """Initialize the tester.
+
+        With results_path set, each full test result is appended to that
+        file as a JSON line, written by a background thread so the event
+        loop never waits on the disk.
+        """
+        self._client_key = (int(api_id), api_hash, session_name)
+        self.client = _CLIENTS.get(self._client_key)
+        if self.client is None:
+            self.client = _CLIENTS[self._client_key] = TelegramClient(
+                session_name, int(api_id), api_hash
+            )
         self.results: list[dict[str, Any]] = []
+        self.results_path = results_path
+        # Encoded result lines for the writer thread; None tells it to stop
+        self._results_queue: queue.SimpleQueue[bytes | None] | None = None
+        self._results_writer: threading.Thread | None = None
+        # Incoming and edited messages per bot chat, pushed by Telegram as
+        # they arrive; other chats are ignored
+        self._inbox: dict[int, asyncio.Queue[Message]] = {}
+        # Bot entities resolved so far, by username
+        self._bots: dict[str, Any] = {}
+        # Event loop time of the last command sent to each bot
+        self._last_sent: dict[int, float] = {}
+        self._command_interval = MIN_COMMAND_INTERVAL
 
     async def start(self) -> None:
-        """Start the Telethon client."""
-        await self.client.start()
+        """Start the Telethon client, unless another tester already has."""
+        if self.results_path:
+            self._results_queue = queue.SimpleQueue()
+            self._results_writer = threading.Thread(
+                target=self._write_results,
+                args=(open(self.results_path, "ab"), self._results_queue),
+                daemon=True,
+            )
+            self._results_writer.start()
+        users = _CLIENT_USERS.get(self._client_key, 0)
+        _CLIENT_USERS[self._client_key] = users + 1
+        if not users:
+            await self.client.start()
+        self.client.add_event_handler(
+            self._on_message, events.NewMessage(incoming=True)
+        )
+        # Bots may send a placeholder and edit it into the actual reply
+        self.client.add_event_handler(
+            self._on_message, events.MessageEdited(incoming=True)
+        )
         print(f"✅ Connected as: {(await self.client.get_me()).username}")
 
+    async def _on_message(self, event: events.NewMessage.Event) -> None:
+        """Queue an incoming or edited message, if it is from a tested bot."""
+        inbox = self._inbox.get(event.chat_id)
+        if inbox is not None:
+            inbox.put_nowait(event.message)
+
     async def stop(self) -> None:
-        """Stop the Telethon client."""
-        await self.client.disconnect()
+        """Stop the Telethon client once no other tester is using it."""
+        self.client.remove_event_handler(self._on_message)
+        users = _CLIENT_USERS.pop(self._client_key, 0) - 1
+        if users > 0:
+            _CLIENT_USERS[self._client_key] = users
+        else:
+            _CLIENTS.pop(self._client_key, None)
+            await self.client.disconnect()
+        if self._results_writer is not None:
+            self._results_queue.put(None)
+            await asyncio.to_thread(self._results_writer.join)
+            self._results_queue = self._results_writer = None
+
+    @staticmethod
+    def _write_results(log: IO[bytes], lines: queue.SimpleQueue[bytes | None]) -> None:
+        """Append queued result lines to the results log until told to stop."""
+        with log:
+            while (line := lines.get()) is not None:
+                log.write(line)
+                log.flush()
 
     async def send_command(
         self,
@@ -100,38 +352,92 @@ class BotTester:
         timeout: int = 30,
     ) -> list[Message]:
         """Send a command to the bot and wait for response."""
-        # Resolve bot entity
-        bot = await self.client.get_entity(bot_username)
-
-        # Send the command
-        await self.client.send_message(bot, command)
-        print(f"📤 Sent: {command}")
-
-        # Wait for response(s)
-        await asyncio.sleep(2)  # Initial wait
+        # Resolve bot entity, once per bot
+        bot = self._bots.get(bot_username)
+        if bot is None:
+            bot = self._bots[bot_username] = await self.client.get_entity(bot_username)
+            self._inbox[bot.id] = asyncio.Queue()
+
+        # Drop replies that arrived late for an earlier command
+        inbox = self._inbox[bot.id]
+        while not inbox.empty():
+            inbox.get_nowait()
+
+        # Keep commands to the bot the current interval apart; time spent
+        # waiting for the previous replies counts towards it
+        loop = asyncio.get_running_loop()
+        last_sent = self._last_sent.get(bot.id)
+        if last_sent is not None:
+            pause = last_sent + self._command_interval - loop.time()
+            if pause > 0:
+                await asyncio.sleep(pause)
+
+        # Send the command, waiting out any flood wait Telegram imposes. Only
+        # this request raises short flood waits too (other calls keep
+        # Telethon's default of sleeping through them), so pacing sees them
+        request = SendMessageRequest(utils.get_input_peer(bot), command)
+        while True:
+            self._last_sent[bot.id] = loop.time()
+            try:
+                await self.client(request, flood_sleep_threshold=0)
+            except FloodWaitError as e:
+                self._command_interval = min(
+                    max(self._command_interval * 2, e.seconds), MAX_COMMAND_INTERVAL
+                )
+                logger.warning("⏳ Flood wait: retrying in %ss", e.seconds)
+                await asyncio.sleep(e.seconds)
+            else:
+                break
+        self._command_interval = max(
+            MIN_COMMAND_INTERVAL, self._command_interval * 0.75
+        )
+        logger.info("📤 Sent: %s", command)
 
-        # Get recent messages from bot
+        # Wait for the first reply, then take the rest until the bot is quiet;
+        # an edit replaces the version of the message taken earlier
         messages = []
-        async for message in self.client.iter_messages(
-            bot,
-            limit=5,
-            from_user=bot,
-        ):
-            # Only include messages after our command
-            messages.append(message)
+        positions: dict[int, int] = {}
+        wait = timeout
+        while len(messages) < MAX_REPLIES:
+            try:
+                message = await asyncio.wait_for(inbox.get(), wait)
+            except asyncio.TimeoutError:
+                break
+            if message.id in positions:
+                messages[positions[message.id]] = message
+            else:
+                positions[message.id] = len(messages)
+                messages.append(message)
+            wait = REPLY_QUIET_PERIOD
 
-        return messages[::-1]  # Reverse to get chronological order
+        return messages
 
     async def test_command(
         self,
         bot_username: str,
         command: str,
-        test_case: dict[str, Any],
+        test_case: TestCase,
+    ) -> dict[str, Any]:
+        """Test a single command.
+
+        Returns the result's SUMMARY_FIELDS; the full result goes to the
+        results log, if there is one.
+        """
+        result = await self._run_test_case(bot_username, command, test_case)
+        if self._results_queue is not None:
+            self._results_queue.put(_dump_json_line(result))
+        return {field: result[field] for field in SUMMARY_FIELDS}
+
+    async def _run_test_case(
+        self,
+        bot_username: str,
+        command: str,
+        test_case: TestCase,
     ) -> dict[str, Any]:
-        """Test a single command."""
+        """Send a command and check the responses against the test case."""
         result = {
             "command": command,
-            "description": test_case.get("description", ""),
+            "description": test_case.description,
             "timestamp": datetime.now().isoformat(),
             "success": False,
             "responses": [],
@@ -139,8 +445,9 @@ class BotTester:
         }
 
         try:
-            timeout = test_case.get("timeout", 30)
-            messages = await self.send_command(bot_username, command, timeout)
+            messages = await self.send_command(
+                bot_username, command, test_case.timeout
+            )
 
             if not messages:
                 result["errors"].append("No response received")
@@ -157,16 +464,11 @@ class BotTester:
             result["responses"] = responses
 
             # Check expected content
-            expected = test_case.get("expected_contains", [])
-            all_text = " ".join(responses).lower()
+            expected = test_case.expected_contains
+            found = find_keywords(expected, responses) if expected else set()
 
-            matched = []
-            missing = []
-            for keyword in expected:
-                if keyword.lower() in all_text:
-                    matched.append(keyword)
-                else:
-                    missing.append(keyword)
+            matched = [keyword for keyword in expected if keyword in found]
+            missing = [keyword for keyword in expected if keyword not in found]
 
             if missing:
                 result["errors"].append(f"Missing keywords: {missing}")
@@ -187,7 +489,7 @@ class BotTester:
 
         for command, test_case in TEST_CASES.items():
             print(f"\n🧪 Testing: {command}")
-            print(f"   {test_case.get('description', '')}")
+            print(f"   {test_case.description}")
 
             result = await self.test_command(bot_username, command, test_case)
             results.append(result)
@@ -197,9 +499,6 @@ class BotTester:
             else:
                 print(f"   ❌ FAILED: {result['errors']}")
 
-            # Delay between tests to avoid rate limiting
-            await asyncio.sleep(3)
-
         return results
 
     async def interactive_mode(self, bot_username: str) -> None:
@@ -209,7 +508,7 @@ class BotTester:
 
         while True:
             try:
-                command = input("Command> ").strip()
+                command = (await read_line("Command> ")).strip()
                 if command.lower() in ["quit", "exit", "q"]:
                     break
 
@@ -224,28 +523,32 @@ class BotTester:
                     print(f"   {text[:200]}...")
                 print()
 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
+                # Ctrl+C cancels the main task rather than raising here
                 break
 
     def print_summary(self, results: list[dict[str, Any]]) -> None:
         """Print test summary."""
-        print("\n" + "=" * 60)
-        print("TEST SUMMARY")
-        print("=" * 60)
+        # Built up front and written in one go rather than line by line
+        lines = ["", "=" * 60, "TEST SUMMARY", "=" * 60]
 
         passed = sum(1 for r in results if r["success"])
         failed = len(results) - passed
 
         for result in results:
             status = "✅" if result["success"] else "❌"
-            print(f"{status} {result['command']}: {result['description']}")
-            if not result["success"] and result["errors"]:
-                for error in result["errors"]:
-                    print(f"   └── {error}")
+            lines.append(f"{status} {result['command']}: {result['description']}")
+            if not result["success"]:
+                lines.extend(f"   └── {error}" for error in result["errors"])
 
-        print("\n" + "-" * 60)
-        print(f"Total: {len(results)} | Passed: {passed} | Failed: {failed}")
-        print("=" * 60)
+        lines += [
+            "",
+            "-" * 60,
+            f"Total: {len(results)} | Passed: {passed} | Failed: {failed}",
+            "=" * 60,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 async def main():
@@ -259,15 +562,28 @@ async def main():
     parser.add_argument(
         "--bot", type=str, default=BOT_USERNAME, help="Bot username to test"
     )
+    parser.add_argument(
+        "--results",
+        type=str,
+        help="Append full results (with bot responses) to this NDJSON file",
+    )
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="Show every message sent"
+    )
     args = parser.parse_args()
 
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(message)s",
+    )
+
     # Validate configuration
     if not API_ID or not API_HASH:
         print("❌ Error: TELEGRAM_API_ID and TELEGRAM_API_HASH must be set")
         print("   Get them from https://my.telegram.org/apps")
         sys.exit(1)
 
-    tester = BotTester(API_ID, API_HASH, SESSION_NAME)
+    tester = BotTester(API_ID, API_HASH, SESSION_NAME, args.results)
 
     try:
         await tester.start()
@@ -276,7 +592,7 @@ async def main():
             await tester.interactive_mode(args.bot)
         elif args.command:
             # Test single command
-            test_case = TEST_CASES.get(args.command, {"description": "Custom command"})
+            test_case = TEST_CASES.get(args.command, TestCase("Custom command"))
             result = await tester.test_command(args.bot, args.command, test_case)
             tester.print_summary([result])
         elif args.all:
@@ -293,4 +609,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
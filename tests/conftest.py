@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from a_bot_tester import scenario
+
+
+@pytest.fixture(autouse=True)
+def scenario_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the scenario parse cache out of the user's home directory."""
+    cache_dir = tmp_path / "scenario_cache"
+    monkeypatch.setattr(scenario, "SCENARIO_CACHE_DIR", cache_dir)
+    return cache_dir
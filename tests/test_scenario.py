@@ -5,7 +5,13 @@ from pathlib import Path
 
 import pytest
 
-from a_bot_tester.scenario import load_scenario, TestCase, TestScenario
+from a_bot_tester.scenario import (
+    iter_scenarios,
+    load_all_scenarios,
+    load_scenario,
+    TestCase,
+    TestScenario,
+)
 
 
 class TestLoadScenario:
@@ -74,3 +80,79 @@ tests:
         
         assert scenario.tests[0].skip is True
         assert scenario.tests[0].skip_reason == "Not implemented yet"
+
+    def test_load_scenario_with_fail_fast(self, tmp_path: Path) -> None:
+        """Test loading scenario with fail_fast validation."""
+        scenario_content = """
+name: Fail Fast Test
+
+tests:
+  - name: Strict Test
+    command: /start
+    fail_fast: true
+  - name: Lenient Test
+    command: /help
+"""
+        scenario_file = tmp_path / "fail_fast_test.yaml"
+        scenario_file.write_text(scenario_content)
+        
+        scenario = load_scenario(scenario_file)
+        
+        assert scenario.tests[0].fail_fast is True
+        assert scenario.tests[1].fail_fast is False
+
+    def test_load_scenario_cache_invalidated_on_change(
+        self, tmp_path: Path, scenario_cache_dir: Path
+    ) -> None:
+        """Test cached scenarios are reparsed when the file changes."""
+        scenario_file = tmp_path / "cached.yaml"
+        scenario_file.write_text("name: First\ntests: []\n")
+        
+        assert load_scenario(scenario_file).name == "First"
+        assert len(list(scenario_cache_dir.iterdir())) == 1
+        
+        scenario_file.write_text("name: Second version\ntests: []\n")
+        
+        assert load_scenario(scenario_file).name == "Second version"
+
+
+class TestLoadAllScenarios:
+    """Tests for loading a directory of scenarios."""
+
+    def test_load_all_scenarios_sorted(self, tmp_path: Path) -> None:
+        """Test .yaml and .yml files are loaded in file name order."""
+        (tmp_path / "b.yml").write_text("name: B\ntests: []\n")
+        (tmp_path / "a.yaml").write_text("name: A\ntests: []\n")
+        (tmp_path / "notes.txt").write_text("not a scenario")
+        
+        scenarios = load_all_scenarios(tmp_path)
+        
+        assert [s.name for s in scenarios] == ["A", "B"]
+
+    def test_load_all_scenarios_skips_invalid(self, tmp_path: Path) -> None:
+        """Test a broken file is skipped without failing the others."""
+        (tmp_path / "good.yaml").write_text("name: Good\ntests: []\n")
+        (tmp_path / "bad.yaml").write_text("tests:\n  - command: /missing_name\n")
+        
+        scenarios = load_all_scenarios(tmp_path)
+        
+        assert [s.name for s in scenarios] == ["Good"]
+
+
+class TestIterScenarios:
+    """Tests for streaming a multi-document scenario file."""
+
+    def test_iter_scenarios(self, tmp_path: Path) -> None:
+        """Test each document becomes a scenario, unnamed ones by index."""
+        scenario_file = tmp_path / "suite.yaml"
+        scenario_file.write_text(
+            "name: First\ntests: []\n"
+            "---\n"
+            "tests:\n  - name: Ping\n    command: /ping\n"
+            "---\n"
+        )
+        
+        scenarios = list(iter_scenarios(scenario_file))
+        
+        assert [s.name for s in scenarios] == ["First", "suite-1"]
+        assert scenarios[1].tests[0].command == "/ping"
@@ -1,10 +1,14 @@
 """Tests for response validators."""
 
+from dataclasses import dataclass
+from typing import Any
+
 import pytest
-from unittest.mock import MagicMock
 
+from a_bot_tester import validator as validator_module
 from a_bot_tester.validator import (
     ContainsTextValidator,
+    FusedContainsValidator,
     MatchesPatternValidator,
     HasButtonsValidator,
     ResponseCountValidator,
@@ -13,13 +17,28 @@ from a_bot_tester.validator import (
 )
 
 
+@dataclass(slots=True)
+class FakeButton:
+    """Inline button with just the fields validators read."""
+    
+    text: str = ""
+
+
+@dataclass(slots=True)
+class FakeMsg:
+    """Bot message with just the fields validators read."""
+    
+    text: str | None = None
+    media: Any = None
+    buttons: Any = None
+
+
 class TestContainsTextValidator:
     """Tests for ContainsTextValidator."""
 
     def test_contains_text_found(self) -> None:
         """Test when text is found in response."""
-        msg = MagicMock()
-        msg.text = "Welcome to the bot!"
+        msg = FakeMsg(text="Welcome to the bot!")
         
         validator = ContainsTextValidator("Welcome")
         result = validator.validate(msg)
@@ -29,8 +48,7 @@ class TestContainsTextValidator:
 
     def test_contains_text_not_found(self) -> None:
         """Test when text is not found in response."""
-        msg = MagicMock()
-        msg.text = "Hello world"
+        msg = FakeMsg(text="Hello world")
         
         validator = ContainsTextValidator("Welcome")
         result = validator.validate(msg)
@@ -39,8 +57,7 @@ class TestContainsTextValidator:
 
     def test_contains_text_case_insensitive(self) -> None:
         """Test case insensitive search."""
-        msg = MagicMock()
-        msg.text = "WELCOME to the bot"
+        msg = FakeMsg(text="WELCOME to the bot")
         
         validator = ContainsTextValidator("welcome", case_sensitive=False)
         result = validator.validate(msg)
@@ -48,15 +65,41 @@ class TestContainsTextValidator:
         assert result.passed is True
 
 
+class TestHasButtonsValidator:
+    """Tests for HasButtonsValidator."""
+
+    def test_expected_buttons_present(self) -> None:
+        """Test when all expected buttons are present."""
+        msg = FakeMsg(
+            buttons=[
+                [FakeButton(text="Yes"), FakeButton(text="No")],
+                [FakeButton(text="Back")],
+            ]
+        )
+        
+        validator = HasButtonsValidator(button_texts=["Back", "Yes"], min_buttons=3)
+        result = validator.validate(msg)
+        
+        assert result.passed is True
+        assert result.details["buttons"] == ["Yes", "No", "Back"]
+
+    def test_expected_button_missing(self) -> None:
+        """Test when an expected button is missing."""
+        msg = FakeMsg(buttons=[[FakeButton(text="Yes")]])
+        
+        validator = HasButtonsValidator(button_texts=["Yes", "Cancel"])
+        result = validator.validate(msg)
+        
+        assert result.passed is False
+        assert "Cancel" in result.message
+
+
 class TestNotEmptyValidator:
     """Tests for NotEmptyValidator."""
 
     def test_not_empty_with_text(self) -> None:
         """Test response with text is not empty."""
-        msg = MagicMock()
-        msg.text = "Hello"
-        msg.media = None
-        msg.buttons = None
+        msg = FakeMsg(text="Hello")
         
         validator = NotEmptyValidator()
         result = validator.validate(msg)
@@ -65,10 +108,7 @@ class TestNotEmptyValidator:
 
     def test_not_empty_with_buttons(self) -> None:
         """Test response with buttons is not empty."""
-        msg = MagicMock()
-        msg.text = None
-        msg.media = None
-        msg.buttons = [[MagicMock()]]
+        msg = FakeMsg(buttons=[[FakeButton()]])
         
         validator = NotEmptyValidator()
         result = validator.validate(msg)
@@ -103,3 +143,52 @@ class TestCreateValidatorsFromConfig:
         validators = create_validators_from_config(config)
         
         assert len(validators) == 2
+
+    def test_key_precedence(self) -> None:
+        """Test an item naming several validators builds the first by precedence."""
+        config = [{"not_empty": True, "matches": "x", "contains": "Hello"}]
+        validators = create_validators_from_config(config)
+        
+        assert len(validators) == 1
+        assert isinstance(validators[0], ContainsTextValidator)
+
+    def test_many_contains_without_ahocorasick(self, monkeypatch) -> None:
+        """Test contains checks stay separate when pyahocorasick is missing."""
+        monkeypatch.setattr(validator_module, "ahocorasick", None)
+        config = [{"contains": "a"}, {"contains": "b"}, {"contains": "c"}]
+        validators = create_validators_from_config(config)
+        
+        assert len(validators) == 3
+        assert all(isinstance(v, ContainsTextValidator) for v in validators)
+
+    def test_many_contains_fused(self) -> None:
+        """Test many contains checks are fused into one validator."""
+        pytest.importorskip("ahocorasick")
+        config = [
+            {"contains": "Hello"},
+            {"not_empty": True},
+            {"contains": "world"},
+            {"contains": "BOT"},
+        ]
+        validators = create_validators_from_config(config)
+        
+        assert len(validators) == 2
+        assert isinstance(validators[0], FusedContainsValidator)
+        
+        msg = FakeMsg(text="hello world from the bot")
+        assert validators[0].validate([msg]).passed is True
+        
+        msg.text = "hello world"
+        result = validators[0].validate([msg])
+        assert result.passed is False
+        assert result.details["missing"] == ["BOT"]
+
+    def test_many_contains_fused_same_text_in_other_case(self) -> None:
+        """Test fused checks for texts differing only in case all pass."""
+        pytest.importorskip("ahocorasick")
+        config = [{"contains": "OK"}, {"contains": "ok"}, {"contains": "done"}]
+        validators = create_validators_from_config(config)
+        
+        assert len(validators) == 1
+        assert isinstance(validators[0], FusedContainsValidator)
+        assert validators[0].validate([FakeMsg(text="ok done")]).passed is True